@@ -0,0 +1,191 @@
+# assets.py
+"""Preconverted sprite cache: one atlas, the prescaled background and button hit masks.
+
+The cache lives in ASSET_CACHE_DIR as raw pixel data plus a manifest keyed by a hash of
+the source images; it is rebuilt automatically when a source changes. Build it ahead of
+time (e.g. while packaging) with: python assets.py
+"""
+import hashlib
+import json
+import os
+import sys
+import pygame
+from config import *
+
+CACHE_VERSION = 1
+ATLAS_WIDTH = 1024
+SPRITE_PATHS = ([BUBBLE_SPRITE.format(name) for _, name in BUBBLE_COLOR_PAIRS] + [ARROW_PATH] +
+                [path for _, path in GAME_OVER_ASSETS] + [path for _, path in HUD_ASSETS])
+MASK_PATHS = [path for _, path in GAME_OVER_ASSETS] + [path for _, path in HUD_ASSETS]
+
+_OPAQUE = bytes(int(a > 127) for a in range(256))   # pygame.mask.from_surface's default threshold
+
+class HitMask:
+    """Read-only hit mask (one byte per pixel) with pygame.mask.Mask's get_at/get_size."""
+    __slots__ = ("size", "data")
+
+    def __init__(self, size: tuple[int, int], data):
+        self.size = size
+        self.data = data                    # row-major, 1 where the sprite is opaque
+
+    @classmethod
+    def from_surface(cls, surf: pygame.Surface) -> "HitMask":
+        return cls(surf.get_size(), pygame.image.tobytes(surf, "RGBA")[3::4].translate(_OPAQUE))
+
+    def get_size(self) -> tuple[int, int]:
+        return self.size
+
+    def get_at(self, pos) -> int:
+        x, y = pos
+        if not (0 <= x < self.size[0] and 0 <= y < self.size[1]):
+            raise IndexError(f"{pos} outside mask of size {self.size}")
+        return self.data[y * self.size[0] + x]
+
+class AssetCache:
+    """Sprites (atlas subsurfaces), background and hit masks, looked up by source path.
+
+    Needs a display mode set: surfaces come back in the display's pixel format.
+    """
+    def __init__(self, atlas: pygame.Surface, rects: dict[str, tuple], background: pygame.Surface,
+                 masks: dict[str, HitMask]):
+        self.atlas = atlas
+        self.rects = rects
+        self.background = background
+        self.masks = masks
+
+    def image(self, path) -> pygame.Surface:
+        return self.atlas.subsurface(self.rects[path])
+
+    def mask(self, path) -> HitMask:
+        return self.masks[path]
+
+    # --- building ---------------------------------------------------------
+
+    @classmethod
+    def build(cls) -> "AssetCache":
+        """Load, convert and pack every source image (the slow path the cache replaces)."""
+        sprites, rects, seen = {}, {}, {}
+        for path in SPRITE_PATHS:
+            surf = pygame.image.load(path).convert_alpha()
+            key = pygame.image.tobytes(surf, "RGBA")        # identical images share one slot
+            if key not in seen:
+                seen[key] = path
+                sprites[path] = surf
+            rects[path] = seen[key]
+
+        # shelf packing, tallest first
+        placed, x, y, shelf_h = {}, 0, 0, 0
+        for path, surf in sorted(sprites.items(), key=lambda item: -item[1].get_height()):
+            w, h = surf.get_size()
+            if x + w > ATLAS_WIDTH:
+                x, y, shelf_h = 0, y + shelf_h, 0
+            placed[path] = (x, y, w, h)
+            x += w
+            shelf_h = max(shelf_h, h)
+        atlas = pygame.Surface((ATLAS_WIDTH, y + shelf_h), pygame.SRCALPHA).convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        for path, surf in sprites.items():
+            atlas.blit(surf, placed[path][:2], special_flags=pygame.BLEND_RGBA_ADD)
+        rects = {path: placed[src] for path, src in rects.items()}
+
+        background = pygame.image.load(BACKGROUND_PATH).convert()
+        background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        masks = {path: HitMask.from_surface(atlas.subsurface(rects[path])) for path in MASK_PATHS}
+        return cls(atlas, rects, background, masks)
+
+    # --- cache files ------------------------------------------------------
+
+    @staticmethod
+    def source_hash() -> str:
+        """Hash of every source image plus the settings baked into the cache."""
+        h = hashlib.sha1(f"{CACHE_VERSION} {ATLAS_WIDTH} {SCREEN_WIDTH}x{SCREEN_HEIGHT}".encode())
+        for path in [BACKGROUND_PATH, *SPRITE_PATHS]:
+            h.update(path.encode())
+            with open(path, "rb") as f:
+                h.update(f.read())
+        return h.hexdigest()
+
+    def save(self, directory, source_hash):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "atlas.raw"), "wb") as f:
+            f.write(pygame.image.tobytes(self.atlas, "RGBA"))
+        with open(os.path.join(directory, "background.raw"), "wb") as f:
+            f.write(pygame.image.tobytes(self.background, "RGB"))
+        offsets, blob = {}, bytearray()
+        for path, mask in self.masks.items():
+            offsets[path] = [len(blob), *mask.get_size()]
+            blob += mask.data
+        with open(os.path.join(directory, "masks.raw"), "wb") as f:
+            f.write(blob)
+        manifest = {"hash": source_hash, "atlas": self.atlas.get_size(),
+                    "background": self.background.get_size(), "sprites": self.rects, "masks": offsets}
+        # manifest last: a cache without one (interrupted write) is never trusted
+        with open(os.path.join(directory, "manifest.json"), "w") as f:
+            json.dump(manifest, f)
+
+    @staticmethod
+    def read(directory, source_hash) -> dict | None:
+        """Read the cache files in directory (no pygame calls, so any thread may do it).
+
+        Returns the manifest plus file contents, or None if missing, unreadable or stale."""
+        try:
+            with open(os.path.join(directory, "manifest.json")) as f:
+                files = {"manifest": json.load(f)}
+            if files["manifest"]["hash"] != source_hash:
+                return None
+            for name in ("atlas", "background", "masks"):
+                with open(os.path.join(directory, f"{name}.raw"), "rb") as f:
+                    files[name] = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return files
+
+    @classmethod
+    def from_files(cls, files: dict) -> "AssetCache | None":
+        """Turn read() output into display-format surfaces; None if the data is corrupt."""
+        manifest = files["manifest"]
+        try:
+            atlas = pygame.image.frombytes(files["atlas"], manifest["atlas"], "RGBA").convert_alpha()
+            background = pygame.image.frombytes(files["background"], manifest["background"], "RGB").convert()
+        except (ValueError, KeyError, pygame.error):
+            return None
+        blob = memoryview(files["masks"])
+        masks = {}
+        for path, (offset, w, h) in manifest["masks"].items():
+            masks[path] = HitMask((w, h), blob[offset:offset + w * h])
+        rects = {path: tuple(rect) for path, rect in manifest["sprites"].items()}
+        return cls(atlas, rects, background, masks)
+
+def read_assets(directory=ASSET_CACHE_DIR) -> tuple[str | None, dict | None]:
+    """File half of load_assets, safe off the main thread: (source hash, cache files or None)."""
+    if directory is None:
+        return None, None
+    source_hash = AssetCache.source_hash()
+    return source_hash, AssetCache.read(directory, source_hash)
+
+def load_assets(directory=ASSET_CACHE_DIR, prefetched=None) -> AssetCache:
+    """The cached assets, rebuilding (and trying to store) the cache when stale.
+
+    prefetched: read_assets(directory) output, if that already ran (e.g. on a loader thread).
+    With directory None the sources are loaded directly every time.
+    """
+    if directory is None:
+        return AssetCache.build()
+    source_hash, files = prefetched if prefetched is not None else read_assets(directory)
+    cache = AssetCache.from_files(files) if files is not None else None
+    if cache is None:
+        cache = AssetCache.build()
+        try:
+            cache.save(directory, source_hash)
+        except OSError as e:
+            print("Asset cache not written:", e)
+    return cache
+
+if __name__ == "__main__":
+    pygame.display.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    directory = sys.argv[1] if len(sys.argv) > 1 else ASSET_CACHE_DIR
+    cache = AssetCache.build()
+    cache.save(directory, AssetCache.source_hash())
+    print(f"{len(cache.rects)} sprites in a {cache.atlas.get_width()}x{cache.atlas.get_height()} atlas, "
+          f"{len(cache.masks)} masks -> {directory}")
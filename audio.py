@@ -1,6 +1,13 @@
+import io
+import os
+import queue
+import threading
 import pygame
 import random
-from config import TRACKS, POP_SOUND_PATHS, PLOP_SOUND_PATH, CLICK_SOUND_PATH, TITLES
+from math import sqrt
+from time import perf_counter
+from config import (TRACKS, POP_SOUND_PATHS, PLOP_SOUND_PATH, CLICK_SOUND_PATH, TITLES,
+                    SFX_CHANNELS, CASCADE_LAYERS)
 
 class AudioManager:
     NEXT_EVENT = pygame.USEREVENT + 1
@@ -14,23 +21,42 @@ class AudioManager:
             return
 
         self.enabled: bool = True
+        self.rng = random.Random()      # own stream: sound picks never touch the game's RNG
         self.playlist = TRACKS
         self.playlist_len = len(self.playlist)
         self.track_num = 0
         self.titles = TITLES
         self.track_name = self.titles[0]
         self.loop: bool = True
+        # track files read into memory by the prefetch thread: the current one and its
+        # neighbours, so switching never waits on the disk
+        self.track_data: dict[int, bytes] = {}
+        self.queued: int | None = None      # track queued to follow the current one
+        self.requests = queue.Queue()
+        threading.Thread(target=self._prefetch_worker, name="music-prefetch", daemon=True).start()
 
         pygame.mixer.music.set_volume(0.5)
         pygame.mixer.music.set_endevent(self.NEXT_EVENT)
         self.play_current()
 
+        # effects play only on reserved channels 0..SFX_CHANNELS-1, so they never grab
+        # channels outside the pool; the volume per voice is set on its channel
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), SFX_CHANNELS))
+        pygame.mixer.set_reserved(SFX_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(SFX_CHANNELS)]
+        self.started = [0.0] * SFX_CHANNELS # start time of each channel's voice, s
+        self.ends = [0.0] * SFX_CHANNELS    # when it finishes; the channel is free after
+        self.clock = perf_counter           # seconds; replaceable to drive the pool off game time
         self.pop_sounds = [pygame.mixer.Sound(p) for p in POP_SOUND_PATHS]
-        for s in self.pop_sounds:
-            s.set_volume(0.5)
-
-        self.plop_sound = pygame.mixer.Sound(PLOP_SOUND_PATH); self.plop_sound.set_volume(1)
-        self.click_sound = pygame.mixer.Sound(CLICK_SOUND_PATH); self.click_sound.set_volume(0.5)
+        self.plop_sound = pygame.mixer.Sound(PLOP_SOUND_PATH)
+        self.click_sound = pygame.mixer.Sound(CLICK_SOUND_PATH)
+        self.effects = {    # name -> (variants, volume of one voice)
+            "pop": (self.pop_sounds, 0.5),
+            "plop": ([self.plop_sound], 1.0),
+            "click": ([self.click_sound], 0.5),
+        }
+        self.pending: dict[str, int] = {}   # triggers since the last flush_effects, by name
+        self.stats = {"triggered": 0, "played": 0, "merged": 0, "stolen": 0}
 
     @staticmethod
     def _safe(func):
@@ -42,23 +68,133 @@ class AudioManager:
     
     @_safe
     def play_current(self):
-        pygame.mixer.music.load(self.playlist[self.track_num])
+        """Start the current track from memory if prefetched (from disk otherwise)."""
+        pygame.mixer.music.load(*self._source(self.track_num))
         self.track_name = self.titles[self.track_num]
         pygame.mixer.music.play()
+        self.queued = None
+        self.update_music()
+        self._prefetch_around()
 
     
     # effect helpers ------------------------------------
     @_safe
+    def trigger(self, name: str):
+        """Queue one effect; flush_effects() plays everything queued this frame."""
+        self.pending[name] = self.pending.get(name, 0) + 1
+
     def play_pop(self):
-        random.choice(self.pop_sounds).play()
+        self.trigger("pop")
 
-    @_safe
     def play_plop(self):
-        self.plop_sound.play()
+        self.trigger("plop")
 
-    @_safe
     def play_click(self):
-        self.click_sound.play()
+        self.trigger("click")
+
+    def on_event(self, name: str):
+        """Event sink for the simulation: map grid event names to effects."""
+        if name in ("pop", "plop"):
+            self.trigger(name)
+
+    @_safe
+    def flush_effects(self):
+        """Play the frame's queued effects, once per frame.
+
+        n triggers of one effect become a cascade of up to CASCADE_LAYERS voices, each a
+        different variant, at sqrt(n / voices) times the single volume (the loudness of
+        n overlapping voices), capped at full volume.
+        """
+        for name, count in self.pending.items():
+            variants, volume = self.effects[name]
+            layers = min(count, CASCADE_LAYERS, len(variants))
+            gain = min(1.0, volume * sqrt(count / layers))
+            for sound in self.rng.sample(variants, layers):
+                self._voice(sound, gain)
+            self.stats["triggered"] += count
+            self.stats["merged"] += count - layers
+        self.pending.clear()
+
+    def _voice(self, sound: pygame.mixer.Sound, volume: float):
+        """Start sound on a free pool channel, stealing the oldest voice if none is free."""
+        now = self.clock()
+        i = min(range(len(self.channels)), key=self.started.__getitem__)    # oldest voice
+        if self.ends[i] > now:
+            free = [j for j, end in enumerate(self.ends) if end <= now]
+            if free:
+                i = free[0]
+            else:
+                self.stats["stolen"] += 1
+        self.started[i], self.ends[i] = now, now + sound.get_length()
+        self.channels[i].play(sound)
+        self.channels[i].set_volume(volume)
+        self.stats["played"] += 1
+
+    def effect_stats(self) -> dict[str, int]:
+        """Effect counters: triggers, voices played, triggers merged into a cascade and
+        voices cut short; dropped = merged + stolen."""
+        if not self.enabled:
+            return {}
+        return {**self.stats, "dropped": self.stats["merged"] + self.stats["stolen"]}
+
+    # music streaming -----------------------------------
+    def _source(self, index) -> tuple:
+        """music.load/queue arguments for track index: its prefetched bytes, or its path."""
+        path = self.playlist[index]
+        data = self.track_data.get(index)
+        if data is None:
+            return (path,)
+        return io.BytesIO(data), os.path.splitext(path)[1][1:]
+
+    def _following(self) -> int:
+        """Track to play when the current one ends."""
+        return self.track_num if self.loop else (self.track_num + 1) % self.playlist_len
+
+    def _prefetch_around(self):
+        """Keep the current, next and previous tracks in memory and drop the rest."""
+        keep = {self.track_num, (self.track_num + 1) % self.playlist_len,
+                (self.track_num - 1) % self.playlist_len}
+        for index in list(self.track_data):
+            if index not in keep:
+                del self.track_data[index]
+        for index in keep:
+            if index not in self.track_data:
+                self.requests.put(index)
+
+    def _prefetch_worker(self):
+        """Read requested track files (file I/O only; every mixer call stays on the main thread)."""
+        while True:
+            index = self.requests.get()
+            if index in self.track_data:
+                continue
+            try:
+                with open(self.playlist[index], "rb") as f:
+                    self.track_data[index] = f.read()
+            except OSError as e:
+                print("Track not prefetched:", e)
+
+    @_safe
+    def update_music(self):
+        """Once per frame: queue the following track as soon as it is in memory, so the
+        mixer starts it the moment the current one ends, with no load in between."""
+        if self.queued is None and pygame.mixer.music.get_busy():
+            following = self._following()
+            if following in self.track_data:
+                pygame.mixer.music.queue(*self._source(following))
+                self.queued = following
+
+    @_safe
+    def on_music_end(self):
+        """Handle NEXT_EVENT: the queued track has already started, so only the
+        bookkeeping is left; without one, start the following track now."""
+        if self.queued is None:
+            self.track_num = self._following()
+            self.play_current()
+            return
+        self.track_num = self.queued
+        self.track_name = self.titles[self.track_num]
+        self.queued = None
+        self._prefetch_around()
 
     # music controls ------------------------------------
     @_safe
@@ -72,6 +208,8 @@ class AudioManager:
     @_safe
     def toggle_loop(self):
         self.loop = not self.loop
+        self.queued = None      # the following track changed: replace the queued one
+        self.update_music()
 
     @_safe
     def next(self):
@@ -85,7 +223,10 @@ class AudioManager:
 
     @_safe
     def replay(self):
-        self.play_current()
+        """Restart the loaded track; no reload."""
+        pygame.mixer.music.play()
+        self.queued = None
+        self.update_music()
 
     def __del__(self) -> None:
         if getattr(self, "enabled", False):
@@ -0,0 +1,157 @@
+# autoplay.py
+"""Autoplay bot: picks each shot by trying candidate angles on copies of the board.
+
+Every candidate is ray-cast with solve_shot, snapped, matched and cleared on a copy;
+the result is scored by bubbles cleared, floaters dropped and how far down the board
+reaches. With lookahead the preview bubble's best follow-up shot on that board counts
+too. Candidates are split across a multiprocessing pool and collected under a per-shot
+time budget, so the frame loop never waits on them.
+
+    python main.py --autoplay
+"""
+import multiprocessing
+import time
+from math import cos, sin, radians
+from config import *
+from game_logic import Bubble, BubbleGrid
+from trajectory import land_shot, solve_shot
+
+# shot value weights
+W_CLEARED = 10          # per bubble popped by the match
+W_DROPPED = 15          # per floater dropped
+W_GROUP = 3             # per same-colour neighbour when the shot clears nothing
+W_HEIGHT = 4            # per row the board reaches down
+LOOKAHEAD_WEIGHT = 0.5  # share of the preview bubble's best follow-up added to a shot
+LOSING = -1e9           # shot that ends the game
+
+def spread(lo, hi, n) -> list[float]:
+    """n evenly spaced angles from lo to hi inclusive."""
+    if n == 1:
+        return [(lo + hi) / 2]
+    return [lo + (hi - lo) * i / (n - 1) for i in range(n)]
+
+def shoot(grid: BubbleGrid, color, angle):
+    """Play one shot on grid in place (no pop timing, no scoring, no row insertion).
+
+    Returns the landing cell and the shot's value, or (None, LOSING) if it ends the game.
+    """
+    path = solve_shot(grid, (SHOOTER_X, SHOOTER_Y), angle)
+    cell = land_shot(grid, path, Bubble(color, path.contact))
+    if cell is None:
+        return None, LOSING
+    chain = grid.get_connected_same_color(*cell)
+    cleared = dropped = 0
+    if len(chain) >= 3:
+        for r, c in chain:
+            grid.codes[r][c] = 0
+        floaters = grid.find_floaters(chain)
+        for r, c in floaters:
+            grid.codes[r][c] = 0
+        cleared, dropped = len(chain), len(floaters)
+    height = next((r + 1 for r in reversed(range(grid.rows)) if any(grid.codes[r])), 0)
+    value = W_CLEARED * cleared + W_DROPPED * dropped - W_HEIGHT * height
+    if not cleared:
+        value += W_GROUP * (len(chain) - 1)
+    return cell, value
+
+def best_value(grid: BubbleGrid, color, angles) -> float:
+    """Value of color's best shot among angles on grid (grid is left unchanged)."""
+    state = grid.snapshot()
+    board = BubbleGrid.from_snapshot(state)
+    best = LOSING
+    for angle in angles:
+        board.restore(state)
+        best = max(best, shoot(board, color, angle)[1])
+    return best
+
+def evaluate(state, color, next_color, angles, follow_angles=(), deadline=None) -> list[tuple[float, float]]:
+    """(value, angle) for each candidate angle on the board in state (a BubbleGrid
+    snapshot), stopping early once time.time() passes deadline.
+
+    With follow_angles, each value includes LOOKAHEAD_WEIGHT times next_color's best
+    follow-up over follow_angles; angles landing in the same cell share that search.
+    """
+    board = BubbleGrid.from_snapshot(state)
+    follow_up: dict[tuple[int, int], float] = {}
+    results = []
+    for angle in angles:
+        if deadline is not None and time.time() > deadline:
+            break
+        board.restore(state)
+        cell, value = shoot(board, color, angle)
+        if cell is not None and follow_angles:
+            if cell not in follow_up:
+                follow_up[cell] = best_value(board, next_color, follow_angles)
+            value += LOOKAHEAD_WEIGHT * follow_up[cell]
+        results.append((value, angle))
+    return results
+
+def best_angle(sim, angles=AUTOPLAY_ANGLES, lookahead=AUTOPLAY_LOOKAHEAD) -> float:
+    """Greedy choice for sim's current shot, evaluated in this process without a budget."""
+    follow = spread(MIN_ANGLE, MAX_ANGLE, AUTOPLAY_FOLLOW_ANGLES) if lookahead else ()
+    candidates = spread(MIN_ANGLE, MAX_ANGLE, angles)
+    results = evaluate(sim.grid.snapshot(), sim.bubble.color, sim.next_bubble.color, candidates, follow)
+    return max(results)[1]
+
+class AutoPlayer:
+    """Stands in for the mouse: poll(sim) once per frame returns an angle to fire, or None.
+
+    The first poll with the shooter ready hands the candidates to the pool; later polls
+    collect them once all are in or budget_ms has passed, keeping the best found so far.
+    """
+    def __init__(self, angles=AUTOPLAY_ANGLES, budget_ms=AUTOPLAY_BUDGET_MS,
+                 workers=AUTOPLAY_WORKERS, lookahead=AUTOPLAY_LOOKAHEAD):
+        self.angles = angles
+        self.budget = budget_ms / 1000
+        self.follow = spread(MIN_ANGLE, MAX_ANGLE, AUTOPLAY_FOLLOW_ANGLES) if lookahead else ()
+        self.workers = workers or multiprocessing.cpu_count()
+        # spawn: fresh interpreters that inherit none of the parent's SDL state or threads;
+        # each still re-imports the parent's main script as __mp_main__ (under main.py that
+        # is pygame and the UI modules, imported but never initialised), once at pool start
+        self.pool = multiprocessing.get_context("spawn").Pool(self.workers)
+        self.jobs = None            # (shot key, deadline, AsyncResults) of the shot being evaluated
+        self.aim = 90.0             # last chosen angle, for drawing the arrow
+        self.stats = {"shots": 0, "evaluated": 0, "timed_out": 0}
+
+    def poll(self, sim) -> float | None:
+        if not sim.can_shoot():
+            return None
+        key = (id(sim.grid), sim.shots)
+        if self.jobs is None or self.jobs[0] != key:            # new shot, or restarted game
+            self._submit(sim, key)
+            return None
+        _, deadline, jobs = self.jobs
+        if not all(job.ready() for job in jobs) and time.time() < deadline:
+            return None
+
+        results = [r for job in jobs if job.ready() for r in job.get()]
+        self.jobs = None
+        self.stats["shots"] += 1
+        self.stats["evaluated"] += len(results)
+        self.stats["timed_out"] += len(results) < self.angles     # jobs also stop at the deadline
+        if results:
+            self.aim = max(results)[1]
+        else:                                                   # budget too small for any result
+            self.aim = max(evaluate(sim.grid.snapshot(), sim.bubble.color, None,
+                                    spread(MIN_ANGLE, MAX_ANGLE, 9)))[1]
+        return self.aim
+
+    def _submit(self, sim, key):
+        """Queue one job per worker; job k gets every workers-th angle, so any subset of
+        finished jobs still covers the whole range."""
+        deadline = time.time() + self.budget
+        state = sim.grid.snapshot()
+        candidates = spread(MIN_ANGLE, MAX_ANGLE, self.angles)
+        jobs = [self.pool.apply_async(evaluate, (state, sim.bubble.color, sim.next_bubble.color,
+                                                 candidates[k::self.workers], self.follow, deadline))
+                for k in range(self.workers)]
+        self.jobs = (key, deadline, jobs)
+
+    def aim_point(self) -> tuple[float, float]:
+        """A point along the bot's current aim, standing in for the mouse when drawing the arrow."""
+        a = radians(self.aim)
+        return (SHOOTER_X + 100 * cos(a), SHOOTER_Y - 100 * sin(a))
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
@@ -0,0 +1,143 @@
+# batch.py
+"""Batch simulation: N seeded headless games across a process pool, for balancing stats.
+
+Usage: python batch.py GAMES [--policy random|greedy] [--out FILE] [--workers N]
+                             [--seed S] [--max-shots M]
+       python batch.py --summary FILE
+Game i uses seed S + i, so any game can be re-run. Results stream to FILE as one
+fixed-size record per game (in completion order); a score and game-length summary
+and the throughput are printed at the end.
+"""
+import argparse
+import multiprocessing
+import random
+import struct
+import sys
+from time import perf_counter
+
+from config import *
+from autoplay import best_angle
+from simulation import Simulation
+
+MAGIC = b"BSBT"
+VERSION = 1
+POLICIES = ["random", "greedy"]
+HEADER = struct.Struct("<4sBBBBI")  # magic, version, policy, colours, starting rows, max shots
+RECORD = struct.Struct("<QIIHB")    # seed, score, shots, rows added, game over
+GREEDY_ANGLES = 60                  # candidates per greedy shot (no lookahead)
+CHUNK = 4                           # games handed to a worker at a time
+
+def play_game(seed, policy="random", max_shots=500) -> tuple:
+    """Play one game headlessly; return its RECORD fields."""
+    sim = Simulation(seed=seed)
+    aim = random.Random(seed ^ 0x5EED)      # apart from the game's own RNG
+    while sim.shots < max_shots:
+        if policy == "greedy":
+            angle = best_angle(sim, angles=GREEDY_ANGLES, lookahead=False)
+        else:
+            angle = aim.uniform(MIN_ANGLE, MAX_ANGLE)
+        if not sim.step(angle):
+            break
+    return seed, sim.grid.score, sim.shots, sim.grid.rows_added, sim.game_over
+
+def _play(args) -> tuple:
+    return play_game(*args)
+
+def run(games, policy="random", out=None, workers=None, seed=0, max_shots=500) -> list[tuple]:
+    """Play games across workers processes (default: one per CPU), streaming records to out."""
+    f = open(out, "wb") if out else None
+    try:
+        if f:
+            f.write(HEADER.pack(MAGIC, VERSION, POLICIES.index(policy), len(BUBBLE_COLORS),
+                                STARTING_ROWS, max_shots))
+        results = []
+        jobs = [(seed + i, policy, max_shots) for i in range(games)]
+        with multiprocessing.Pool(workers) as pool:
+            for record in pool.imap_unordered(_play, jobs, chunksize=CHUNK):
+                results.append(record)
+                if f:
+                    f.write(RECORD.pack(*record))
+        return results
+    finally:
+        if f:
+            f.close()
+
+def read_results(path) -> tuple[dict, list[tuple]]:
+    """Header fields and records of a results file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, policy, colors, rows, max_shots = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} batch results file")
+    body = data[HEADER.size:]
+    body = body[:len(body) - len(body) % RECORD.size]      # drop a record cut off mid-write
+    header = {"policy": POLICIES[policy], "colors": colors, "starting_rows": rows, "max_shots": max_shots}
+    return header, list(RECORD.iter_unpack(body))
+
+def distribution(label, values, log=False, buckets=10, width=40) -> str:
+    """Percentile line plus a histogram of values: equal-width buckets, or with log
+    one bucket per power of two (for heavy-tailed values such as chain scores)."""
+    values = sorted(values)
+    n = len(values)
+    def pct(q):
+        return values[min(n - 1, n * q // 100)]
+    lines = [f"{label}: min {values[0]}  p10 {pct(10)}  p50 {pct(50)}  p90 {pct(90)}  "
+             f"p99 {pct(99)}  max {values[-1]}  mean {sum(values) / n:.1f}"]
+    counts: dict[int, int] = {}
+    if log:
+        for v in values:
+            counts[v.bit_length()] = counts.get(v.bit_length(), 0) + 1
+        keys = range(values[0].bit_length(), values[-1].bit_length() + 1)
+        ranges = [((1 << k) >> 1, (1 << k) - 1) for k in keys]
+    else:
+        lo = values[0]
+        step = max(1, -(-(values[-1] - lo + 1) // buckets))
+        for v in values:
+            counts[(v - lo) // step] = counts.get((v - lo) // step, 0) + 1
+        keys = range((values[-1] - lo) // step + 1)
+        ranges = [(lo + k * step, lo + (k + 1) * step - 1) for k in keys]
+    top = max(counts.values())
+    for k, (lo, hi) in zip(keys, ranges):
+        count = counts.get(k, 0)
+        lines.append(f"  {lo:>8} .. {hi:<8} {count:7d} {'#' * round(count / top * width)}")
+    return "\n".join(lines)
+
+def summarize(records, header) -> str:
+    lost = sum(r[4] for r in records)
+    lines = [f"{len(records)} games, policy {header['policy']}, {header['colors']} colours, "
+             f"{header['starting_rows']} starting rows; {lost} lost, "
+             f"{len(records) - lost} still going at {header['max_shots']} shots",
+             distribution("score", [r[1] for r in records], log=True),
+             distribution("shots", [r[2] for r in records])]
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python batch.py", description=__doc__.splitlines()[0])
+    parser.add_argument("games", type=int, nargs="?")
+    parser.add_argument("--policy", choices=POLICIES, default="random")
+    parser.add_argument("--out", metavar="FILE", help="stream per-game records here")
+    parser.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of game 0")
+    parser.add_argument("--max-shots", type=int, default=500, help="stop a game after this many shots")
+    parser.add_argument("--summary", metavar="FILE", help="summarize an existing results file")
+    args = parser.parse_args(argv)
+
+    if args.summary:
+        header, records = read_results(args.summary)
+        print(summarize(records, header))
+        return 0
+    if not args.games:
+        parser.error("GAMES is required")
+    workers = args.workers or multiprocessing.cpu_count()
+    t0 = perf_counter()
+    records = run(args.games, args.policy, args.out, workers, args.seed, args.max_shots)
+    elapsed = perf_counter() - t0
+    header = {"policy": args.policy, "colors": len(BUBBLE_COLORS), "starting_rows": STARTING_ROWS,
+              "max_shots": args.max_shots}
+    print(summarize(records, header))
+    print(f"{len(records) / elapsed:,.1f} games/s ({elapsed:.1f} s on {workers} workers, "
+          f"{len(records) / elapsed / workers:,.1f} games/s per worker)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Standalone timing scripts; run from the repo root, e.g. python -m benchmarks.render_modes"""
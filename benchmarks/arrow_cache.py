@@ -0,0 +1,51 @@
+# benchmarks/arrow_cache.py
+"""Per-frame cost of rotating the aim arrow: rotozoom every frame vs RotationCache."""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import random
+from time import perf_counter
+
+import pygame
+from config import *
+from game_view import RotationCache
+
+FRAMES = 5000
+
+def aim_angles(frames=FRAMES, seed=1):
+    """Slow random sweep across MIN_ANGLE..MAX_ANGLE, like a hand on the mouse."""
+    rng = random.Random(seed)
+    angle, out = 90.0, []
+    for _ in range(frames):
+        angle = max(MIN_ANGLE, min(MAX_ANGLE, angle + rng.uniform(-1.5, 1.5)))
+        out.append(angle)
+    return out
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    arrow = pygame.image.load("assets/sprites/arrow.png").convert_alpha()
+    angles = aim_angles()
+
+    t0 = perf_counter()
+    for a in angles:
+        pygame.transform.rotozoom(arrow, a, 1)
+    base = (perf_counter() - t0) / len(angles)
+    print(f"rotozoom every frame      {base * 1e6:8.1f} us/frame")
+
+    for label, preload in (("lazy LRU", False), ("preloaded", True)):
+        t0 = perf_counter()
+        cache = RotationCache(arrow, ARROW_ANGLE_STEP, ARROW_CACHE_SIZE, preload)
+        build = perf_counter() - t0
+        t0 = perf_counter()
+        for a in angles:
+            cache.get(a)
+        per = (perf_counter() - t0) / len(angles)
+        s = cache.stats()
+        print(f"{label:<10} cache          {per * 1e6:8.1f} us/frame  ({base / per:.0f}x)  "
+              f"setup {build * 1e3:.1f} ms  frames {s['frames']}  memory {s['bytes'] / 2**20:.1f} MiB  "
+              f"step {s['step_deg']} deg  hits {s['hits']} misses {s['misses']}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
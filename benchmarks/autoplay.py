@@ -0,0 +1,54 @@
+# benchmarks/autoplay.py
+"""AutoPlayer shot evaluation: time per shot in-process and through pools of 1..N workers.
+
+Boards come from seeded games a few greedy shots in; every shot evaluates
+AUTOPLAY_ANGLES candidates with lookahead, without a time budget."""
+import multiprocessing
+import time
+from statistics import median
+
+from config import *
+from autoplay import AutoPlayer, best_angle
+from simulation import Simulation
+
+SHOTS = 8
+
+def positions() -> list[Simulation]:
+    sims = []
+    for seed in range(SHOTS):
+        sim = Simulation(seed=seed)
+        for _ in range(seed % 4):
+            sim.step(best_angle(sim, angles=30, lookahead=False))
+        sims.append(sim)
+    return sims
+
+def time_bot(bot, sims) -> list[float]:
+    times = []
+    for sim in sims:
+        t0 = time.perf_counter()
+        while bot.poll(sim) is None:
+            time.sleep(0.0005)
+        times.append(time.perf_counter() - t0)
+    return times
+
+def main():
+    sims = positions()
+    inline = []
+    for sim in sims:
+        t0 = time.perf_counter()
+        best_angle(sim)
+        inline.append(time.perf_counter() - t0)
+    print(f"in-process          median {median(inline) * 1000:7.1f} ms/shot")
+
+    cpus = multiprocessing.cpu_count()
+    for workers in sorted({1, 2, cpus}):
+        bot = AutoPlayer(budget_ms=60_000, workers=workers)
+        time_bot(bot, sims[:1])                 # wait for the workers to start
+        times = time_bot(bot, sims)
+        bot.close()
+        print(f"pool of {workers:<3}         median {median(times) * 1000:7.1f} ms/shot   "
+              f"x{median(inline) / median(times):.2f}")
+    print(f"({cpus} CPUs)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bitboard.py
+"""BitBoard vs BubbleGrid: cross-check of matches and floaters, then query throughput.
+
+Run with --check to only cross-check (many seeds, no timings)."""
+import sys
+from time import perf_counter
+
+from bitboard import BitBoard
+from benchmarks.boards import BOARD_SIZES, make_board, occupied_cells
+from benchmarks.color_grid import object_floaters
+
+QUERIES = 200
+
+def cross_check(grid, bb):
+    """Assert BitBoard answers every match query and the floater scan exactly like grid."""
+    for r, c in occupied_cells(grid):
+        assert set(grid.get_connected_same_color(r, c)) == set(bb.connected_same_color(r, c)), (r, c)
+    assert object_floaters(grid) == bb.floating_cells()
+
+def main(check_only=False):
+    sys.setrecursionlimit(100_000)      # BubbleGrid's DFS recurses once per visited cell
+    for name, rows, cols, filled, density in BOARD_SIZES:
+        seeds = range(20) if check_only and rows * cols <= 2000 else range(1)
+        for seed in seeds:
+            grid = make_board(rows, cols, filled, density, seed=seed)
+            bb = BitBoard.from_bubble_grid(grid)
+            cross_check(grid, bb)
+            grid.row_offset = bb.row_offset = True      # same board, other parity
+            cross_check(grid, bb)
+            grid.row_offset = bb.row_offset = False
+        if check_only:
+            print(f"{name:<8} {rows}x{cols}  ok ({len(seeds)} seeds, both parities)")
+            continue
+
+        starts = occupied_cells(grid, QUERIES)
+        t0 = perf_counter()
+        for r, c in starts:
+            grid.get_connected_same_color(r, c)
+        t_obj = (perf_counter() - t0) / len(starts)
+        t0 = perf_counter()
+        for r, c in starts:
+            bb.connected(r, c)
+        t_bb = (perf_counter() - t0) / len(starts)
+
+        t0 = perf_counter()
+        object_floaters(grid)
+        f_obj = perf_counter() - t0
+        reps = 200
+        t0 = perf_counter()
+        for _ in range(reps):
+            bb.floating()
+        f_bb = (perf_counter() - t0) / reps
+        print(f"{name:<8} {rows}x{cols}  match: dfs {t_obj * 1e6:8.1f} us  bitboard {t_bb * 1e6:7.1f} us "
+              f"({1 / t_bb:,.0f}/s)   floaters: dfs {f_obj * 1e3:7.2f} ms  bitboard {f_bb * 1e6:8.1f} us "
+              f"({1 / f_bb:,.0f}/s)")
+
+if __name__ == "__main__":
+    main(check_only="--check" in sys.argv)
@@ -0,0 +1,35 @@
+# benchmarks/boards.py
+"""Fixed-seed synthetic boards shared by the benchmark scripts."""
+import random
+from config import *
+from game_logic import Bubble, BubbleGrid
+
+# (name, rows, cols, filled rows, density)
+BOARD_SIZES = [
+    ("default", GRID_ROWS, GRID_COLS, STARTING_ROWS, 0.9),
+    ("sparse", GRID_ROWS, GRID_COLS, GRID_ROWS - 2, 0.6),
+    ("medium", 40, 40, 30, 0.7),
+    ("large", 120, 100, 90, 0.65),
+]
+
+def make_board(rows=GRID_ROWS, cols=GRID_COLS, filled_rows=STARTING_ROWS, density=0.9,
+               colors=BUBBLE_COLORS, seed=0) -> BubbleGrid:
+    """Fill the top filled_rows with random colours, then punch holes so that
+    roughly density of those cells stay occupied (holes leave floaters behind)."""
+    rng = random.Random(seed)
+    grid = BubbleGrid(cols=cols, rows=rows, rng=rng)
+    for row in range(filled_rows):
+        for col in range(cols):
+            grid.add_bubble(Bubble(rng.choice(colors), grid.get_position_for_cell(row, col)))
+    for row in range(filled_rows):
+        for col in range(cols):
+            if grid.codes[row][col] and rng.random() > density:
+                grid.remove_cell(row, col)
+    return grid
+
+def occupied_cells(grid, limit=None, seed=0) -> list[tuple[int, int]]:
+    """Fixed-seed sample of occupied cells, used as match-query starting points."""
+    cells = [(r, c) for r in range(grid.rows) for c in range(grid.cols) if grid.codes[r][c]]
+    rng = random.Random(seed)
+    rng.shuffle(cells)
+    return cells[:limit] if limit else cells
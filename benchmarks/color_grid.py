@@ -0,0 +1,46 @@
+# benchmarks/color_grid.py
+"""BubbleGrid DFS vs NumPy ColorGrid flood fills: cross-check and timings."""
+import sys
+from time import perf_counter
+
+from color_grid import ColorGrid
+from benchmarks.boards import BOARD_SIZES, make_board, occupied_cells
+
+QUERIES = 200
+
+def timed(fn, repeat):
+    t0 = perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    return (perf_counter() - t0) / repeat, out
+
+def object_floaters(grid):
+    """Run enqueue_floating_bubbles and return the scheduled cells, leaving the grid untouched."""
+    grid.pops.clear()
+    grid.enqueue_floating_bubbles()
+    cells = grid.pops.pending()
+    grid.pops.clear()
+    return cells
+
+def main():
+    sys.setrecursionlimit(100_000)      # BubbleGrid's DFS recurses once per visited cell
+    for name, rows, cols, filled, density in BOARD_SIZES:
+        grid = make_board(rows, cols, filled, density)
+        cg = ColorGrid.from_bubble_grid(grid)
+        starts = occupied_cells(grid, QUERIES)
+
+        # cross-check: identical match sets and identical floater order
+        for r, c in starts:
+            assert set(grid.get_connected_same_color(r, c)) == set(cg.connected_same_color(r, c)), (r, c)
+        assert object_floaters(grid) == cg.floating_cells()
+
+        t_obj, _ = timed(lambda: [grid.get_connected_same_color(r, c) for r, c in starts], 3)
+        t_np, _ = timed(lambda: [cg.connected_same_color(r, c) for r, c in starts], 3)
+        f_obj, floaters = timed(lambda: object_floaters(grid), 3)
+        f_np, _ = timed(cg.floating_cells, 3)
+        n = len(starts)
+        print(f"{name:<8} {rows}x{cols}  match: dfs {t_obj / n * 1e6:8.1f} us  numpy {t_np / n * 1e6:8.1f} us   "
+              f"floaters({len(floaters)}): dfs {f_obj * 1e3:8.2f} ms  numpy {f_np * 1e3:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/floaters.py
+"""Incremental floater detection vs the full top-row scan over seeded games.
+
+Every match is checked: both searches must return the same floaters in the same order."""
+import random
+from time import perf_counter
+
+from config import *
+from simulation import Simulation
+
+SHOTS = 3000
+
+def main(shots=SHOTS, seed=1):
+    random.seed(seed)
+    aim = random.Random(seed)
+    sim = Simulation()
+    t_full = t_inc = 0.0
+    matches = dropped = 0
+
+    for _ in range(shots):
+        if sim.game_over:
+            sim.reset()
+        sim.fire(aim.uniform(MIN_ANGLE, MAX_ANGLE))
+        sim.update(10.0, sim.clock())           # long enough to land any shot
+        grid = sim.grid
+        if grid.pending_floater_check:
+            # pop the chain by hand, then ask both searches for the floaters
+            for row, col in grid.pops.drain():
+                grid.remove_cell(row, col)
+
+            t0 = perf_counter()
+            full = grid.find_floaters()
+            t1 = perf_counter()
+            inc = grid.find_floaters(grid.floater_seeds)
+            t2 = perf_counter()
+            assert full == inc, (full, inc)
+            t_full += t1 - t0
+            t_inc += t2 - t1
+            matches += 1
+            dropped += len(full)
+        grid.flush_pops()
+        sim.update(0, sim.clock())              # reload the shooter
+
+    print(f"{matches} matches, {dropped} floaters, results identical")
+    print(f"full scan   {t_full / matches * 1e6:8.1f} us/match")
+    print(f"incremental {t_inc / matches * 1e6:8.1f} us/match  ({t_full / t_inc:.1f}x)")
+
+if __name__ == "__main__":
+    main()
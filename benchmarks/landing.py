@@ -0,0 +1,61 @@
+# benchmarks/landing.py
+"""Shot landing check: land_shot's cell against the step-by-step Bubble.move flight.
+
+Seeded random-aim games are replayed shot by shot; each shot is landed both ways on
+copies of the board, overflow shots (no cell: game over) included. The flight uses a
+fine time step so its contact point is exact; any difference fails the run (exit 1).
+The flight at the game's own 1/SIM_HZ step is reported alongside for reference.
+"""
+import random
+import sys
+from math import cos, sin, radians
+
+from config import *
+from game_logic import Bubble, BubbleGrid
+from simulation import Simulation
+from trajectory import land_shot, solve_shot
+
+GAMES = 40
+FINE_DT = 1 / 20000
+
+def flight_cell(grid, color, angle, dt):
+    """Landing cell of the step-by-step flight at time step dt, as the game played before solve_shot."""
+    bubble = Bubble(color, (SHOOTER_X, SHOOTER_Y))
+    a = radians(angle)
+    bubble.velocity = (cos(a) * PROJECTILE_SPEED, -sin(a) * PROJECTILE_SPEED)
+    while bubble.is_moving():
+        bubble.move(dt, grid)
+    hit_row, hit_col = bubble.hit_cell or (None, None)
+    return grid.snap_bubble_to_grid(bubble, hit_row, hit_col)
+
+def solved_cell(grid, color, angle):
+    path = solve_shot(grid, (SHOOTER_X, SHOOTER_Y), angle)
+    return land_shot(grid, path, Bubble(color, (SHOOTER_X, SHOOTER_Y)))
+
+def main(games=GAMES) -> int:
+    shots = 0
+    differ = {FINE_DT: 0, SIM_TICK: 0}
+    overflow = {"solved": 0, FINE_DT: 0, SIM_TICK: 0}
+    for seed in range(games):
+        sim = Simulation(seed=seed)
+        aim = random.Random(seed)
+        while True:
+            angle = aim.uniform(MIN_ANGLE, MAX_ANGLE)
+            state = sim.grid.snapshot()
+            cell = solved_cell(BubbleGrid.from_snapshot(state), sim.bubble.color, angle)
+            overflow["solved"] += cell is None
+            for dt in differ:
+                flown = flight_cell(BubbleGrid.from_snapshot(state), sim.bubble.color, angle, dt)
+                differ[dt] += flown != cell
+                overflow[dt] += flown is None
+            shots += 1
+            if not sim.step(angle):
+                break
+    print(f"{games} games, {shots} shots; overflow: land_shot {overflow['solved']}, "
+          f"flight {overflow[FINE_DT]} (fine step), {overflow[SIM_TICK]} ({SIM_HZ} Hz step)")
+    print(f"cells differing from the fine-step flight:     {differ[FINE_DT]}")
+    print(f"cells differing from the {SIM_HZ} Hz step flight: {differ[SIM_TICK]}   (coarse step, for reference)")
+    return 1 if differ[FINE_DT] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+# benchmarks/memory.py
+"""Memory per board and GC cost of keeping many boards alive (batch simulations)."""
+import gc
+import random
+import tracemalloc
+from time import perf_counter
+
+from game_logic import BubbleGrid
+
+SIZES = [("default", 15, 17, 10), ("large", 120, 100, 90)]
+BOARDS = 200
+
+def build(rows, cols, filled):
+    grid = BubbleGrid(cols=cols, rows=rows)
+    grid.populate_random_rows(filled)
+    return grid
+
+def main():
+    random.seed(0)
+    for name, rows, cols, filled in SIZES:
+        build(rows, cols, 0)                # warm the per-size cell tables every board shares
+        gc.collect()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        grid = build(rows, cols, filled)
+        size = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        del grid
+
+        count = BOARDS if rows * cols < 1000 else BOARDS // 20
+        boards = [build(rows, cols, filled) for _ in range(count)]
+        tracked = len(gc.get_objects())
+        t0 = perf_counter()
+        gc.collect()
+        t_gc = perf_counter() - t0
+        print(f"{name:<8} {rows}x{cols} ({filled} rows filled): {size / 1024:8.1f} KiB/board   "
+              f"{count} boards alive: {tracked:,} gc-tracked objects, full collect {t_gc * 1e3:7.2f} ms")
+        del boards
+
+if __name__ == "__main__":
+    main()
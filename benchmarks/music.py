@@ -0,0 +1,86 @@
+# benchmarks/music.py
+"""Main-thread cost of music track changes: the frame-time spike a switch adds.
+
+blocking: music.load(path) + play(), what every change used to do (track ends included).
+prefetched: AudioManager.next()/previous() with the neighbours already in memory.
+end of track: on_music_end() once the queued track has started (bookkeeping only).
+The cold runs evict the track files from the page cache first (posix_fadvise).
+"""
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import time
+from statistics import median
+from time import perf_counter
+
+import pygame
+import audio
+from audio import AudioManager
+
+SWITCHES = 20
+# the tracks shipped in assets/sounds (some TRACKS entries are not in the repo)
+PLAYLIST = ["assets/sounds/cloud_jumper.ogg", "assets/sounds/aquatic-ambience.ogg"]
+
+def evict(paths):
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+def settle(manager):
+    """Let the prefetch thread catch up, as the frames between two switches would."""
+    while not manager.requests.empty():
+        time.sleep(0.001)
+    time.sleep(0.02)
+    manager.update_music()
+
+def report(label, times):
+    ms = sorted(t * 1000 for t in times)
+    print(f"{label:<24} median {median(ms):6.2f} ms   max {ms[-1]:6.2f} ms")
+
+def blocking(cold) -> list[float]:
+    times = []
+    for i in range(SWITCHES):
+        if cold:
+            evict(PLAYLIST)
+        t0 = perf_counter()
+        pygame.mixer.music.load(PLAYLIST[i % len(PLAYLIST)])
+        pygame.mixer.music.play()
+        times.append(perf_counter() - t0)
+    return times
+
+def prefetched(manager, cold) -> list[float]:
+    times = []
+    for i in range(SWITCHES):
+        settle(manager)
+        if cold:
+            evict(PLAYLIST)
+        t0 = perf_counter()
+        manager.next() if i % 2 else manager.previous()
+        times.append(perf_counter() - t0)
+    return times
+
+def track_end(manager) -> list[float]:
+    times = []
+    manager.loop = False
+    for _ in range(SWITCHES):
+        settle(manager)
+        t0 = perf_counter()
+        manager.on_music_end()
+        times.append(perf_counter() - t0)
+    return times
+
+def main():
+    audio.TRACKS, audio.TITLES = PLAYLIST, [os.path.basename(p) for p in PLAYLIST]
+    manager = AudioManager()
+    for cold in (False, True):
+        temp = "cold" if cold else "warm"
+        report(f"blocking ({temp})", blocking(cold))
+        manager.play_current()
+        report(f"prefetched ({temp})", prefetched(manager, cold))
+    report("end of track", track_end(manager))
+
+if __name__ == "__main__":
+    main()
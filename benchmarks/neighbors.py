@@ -0,0 +1,67 @@
+# benchmarks/neighbors.py
+"""Collision and DFS paths with the precomputed neighbour tables vs the old per-call lookup."""
+import random
+import sys
+from time import perf_counter
+
+from config import *
+from game_logic import Bubble
+from benchmarks.boards import BOARD_SIZES, make_board, occupied_cells
+
+def legacy_neighbor_coords(grid, row, col):
+    """The pre-table get_neighbor_coords: rebuilds vectors and a result list per call."""
+    if grid.is_flush_left(row):
+        dir_vectors = [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)]
+    else:
+        dir_vectors = [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)]
+    result = []
+    for (dr, dc), name in zip(dir_vectors, DIRECTIONS):
+        n_row, n_col = row + dr, col + dc
+        if 0 <= n_row < grid.rows and 0 <= n_col < grid.cols:
+            result.append((name, n_row, n_col))
+    return result
+
+def use_legacy(grid):
+    """Route this grid instance's lookups through the old implementation."""
+    grid.get_neighbor_coords = lambda r, c: legacy_neighbor_coords(grid, r, c)
+    grid.neighbor_cells = lambda r, c: [(nr, nc) for _, nr, nc in legacy_neighbor_coords(grid, r, c)]
+
+def probe_positions(n=2000, seed=0):
+    """Random projectile positions across the field."""
+    rng = random.Random(seed)
+    return [(rng.uniform(GRID_LEFT_OFFSET, GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH),
+             rng.uniform(GRID_TOP_OFFSET, SHOOTER_Y)) for _ in range(n)]
+
+def run(grid, probes, starts):
+    bubble = Bubble(BUBBLE_COLORS[0], probes[0])
+    t0 = perf_counter()
+    for pos in probes:
+        bubble.pos = pos
+        bubble.check_collision_with_neighbors(grid)
+    t_coll = (perf_counter() - t0) / len(probes)
+
+    t0 = perf_counter()
+    for r, c in starts:
+        grid.get_connected_same_color(r, c)
+    t_match = (perf_counter() - t0) / len(starts)
+
+    t0 = perf_counter()
+    grid.find_floaters()
+    t_float = perf_counter() - t0
+    return t_coll, t_match, t_float
+
+def main():
+    sys.setrecursionlimit(100_000)
+    probes = probe_positions()
+    for name, rows, cols, filled, density in BOARD_SIZES[:3]:
+        starts = occupied_cells(make_board(rows, cols, filled, density), 300)
+        old = make_board(rows, cols, filled, density)
+        use_legacy(old)
+        new = make_board(rows, cols, filled, density)
+        before, after = run(old, probes, starts), run(new, probes, starts)
+        print(f"{name:<8} {rows}x{cols}")
+        for label, b, a in zip(("collision check", "colour DFS", "floater scan"), before, after):
+            print(f"  {label:<16} before {b * 1e6:9.2f} us  after {a * 1e6:9.2f} us  ({b / a:.1f}x)")
+
+if __name__ == "__main__":
+    main()
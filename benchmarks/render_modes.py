@@ -0,0 +1,71 @@
+# benchmarks/render_modes.py
+"""Frame-time comparison of GameUI.draw_ui (full redraw) and draw_ui_dirty."""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+from math import cos, sin, radians
+from statistics import mean, quantiles
+from time import perf_counter
+
+import pygame
+from config import *
+from audio import AudioManager
+from game_logic import Bubble
+from game_view import GameUI
+from simulation import Simulation
+
+FRAMES = 1200
+
+def play(mode, frames=FRAMES, seed=1):
+    """Drive a scripted game for frames, drawing with mode; return (frame times, final screen)."""
+    random.seed(seed)
+    screen = pygame.display.get_surface()
+    ui = GameUI(screen, AudioManager())
+    sim = Simulation()
+    warning = Bubble(color=GRAY, pos=(PREVIEW_X + 40, PREVIEW_Y))
+    aim = random.Random(seed)
+    angle = 90.0
+    times = []
+
+    for frame in range(frames):
+        now = frame * 1000 // FPS
+        sim.clock.now = now
+        # sweep the aim slowly and fire every second
+        angle = max(MIN_ANGLE, min(MAX_ANGLE, angle + aim.uniform(-2, 2)))
+        mouse = (SHOOTER_X + 200 * cos(radians(angle)), SHOOTER_Y - 200 * sin(radians(angle)))
+        if frame % FPS == 0 and sim.can_shoot():
+            sim.fire(angle)
+        sim.update(1 / FPS, now)
+        if sim.game_over:
+            sim.reset()
+        ui.update_buttons(mouse, False, sim.game_over)
+
+        t0 = perf_counter()
+        if mode == "dirty":
+            pygame.display.update(ui.draw_ui_dirty(sim.grid, sim.bubble, sim.next_bubble, warning, mouse, sim.game_over))
+        else:
+            ui.draw_ui(sim.grid, sim.bubble, sim.next_bubble, warning, mouse, sim.game_over)
+            pygame.display.flip()
+        times.append(perf_counter() - t0)
+    return times, screen.copy()
+
+def report(name, times):
+    p = quantiles(times, n=100)
+    print(f"{name:<6} mean {mean(times) * 1e3:7.3f} ms  p50 {p[49] * 1e3:7.3f} ms  "
+          f"p95 {p[94] * 1e3:7.3f} ms  p99 {p[98] * 1e3:7.3f} ms")
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    full, full_img = play("full")
+    dirty, dirty_img = play("dirty")
+    report("full", full)
+    report("dirty", dirty)
+    same = pygame.image.tobytes(full_img, "RGB") == pygame.image.tobytes(dirty_img, "RGB")
+    print(f"speed-up {mean(full) / mean(dirty):.1f}x, final frames identical: {same}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# benchmarks/snapshot.py
+"""Game snapshots: size, snapshot/restore cost against a fresh reset(), and board copies."""
+import random
+import timeit
+
+from config import *
+from game_logic import BubbleGrid
+from simulation import Simulation
+
+NUMBER = 5000
+
+def per_call(fn) -> float:
+    """Best of 5 runs, microseconds per call."""
+    return min(timeit.repeat(fn, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+def mid_game(seed=1, shots=10) -> Simulation:
+    sim = Simulation(seed=seed)
+    aim = random.Random(seed)
+    for _ in range(shots):
+        sim.step(aim.uniform(MIN_ANGLE, MAX_ANGLE))
+    return sim
+
+def main():
+    sim = mid_game()
+    data = sim.snapshot()
+    grid_data = sim.grid.snapshot()
+    other = Simulation(seed=2)
+    scratch = BubbleGrid.from_snapshot(grid_data)
+    print(f"game snapshot       {len(data)} bytes ({len(grid_data)} of them the grid)")
+    print(f"Simulation.snapshot {per_call(sim.snapshot):8.2f} us")
+    print(f"Simulation.restore  {per_call(lambda: other.restore(data)):8.2f} us")
+    print(f"Simulation.reset    {per_call(lambda: other.reset(3)):8.2f} us   (new random game)")
+    print(f"BubbleGrid.restore  {per_call(lambda: scratch.restore(grid_data)):8.2f} us   (board copy into a reused grid)")
+    print(f"from_snapshot       {per_call(lambda: BubbleGrid.from_snapshot(grid_data)):8.2f} us   (board copy, new grid)")
+
+if __name__ == "__main__":
+    main()
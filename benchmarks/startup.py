@@ -0,0 +1,53 @@
+# benchmarks/startup.py
+"""Time-to-first-frame: fresh processes building main.Game and presenting one game frame.
+
+Also reported: how long Game() takes and how soon its loading frame appears.
+
+Modes: png (no asset cache, every PNG decoded and converted), cold (cache rebuilt
+and written) and warm (cache read back)."""
+import os
+import subprocess
+import sys
+import tempfile
+from statistics import median
+
+RUNS = 7
+CHILD = """
+import time
+t0 = time.perf_counter()
+import config
+config.ASSET_CACHE_DIR = {cache_dir!r}
+import pygame
+from main import Game
+t1 = time.perf_counter()
+game = Game()
+t2 = time.perf_counter()
+sim = game.sim
+game.ui.draw_ui(sim.grid, sim.bubble, sim.next_bubble, game.warning_bubble, (0, 0), sim.game_over)
+pygame.display.flip()
+print(time.perf_counter() - t0, t2 - t1, game.startup["first frame"])
+"""
+
+def first_frame(cache_dir) -> tuple[float, float, float]:
+    """(process start to first game frame, Game() construction, Game() to loading frame) in seconds."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-c", CHILD.format(cache_dir=cache_dir)], env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return tuple(float(t) for t in out.split()[-3:])
+
+def main(runs=RUNS):
+    with tempfile.TemporaryDirectory() as tmp:
+        modes = {
+            "png": lambda i: None,
+            "cold": lambda i: os.path.join(tmp, f"cold{i}"),    # a new, empty cache dir per run
+            "warm": lambda i: os.path.join(tmp, "warm"),
+        }
+        first_frame(modes["warm"](0))                           # populate the warm cache
+        for name, cache_dir in modes.items():
+            totals, games, loading = zip(*(first_frame(cache_dir(i)) for i in range(runs)))
+            print(f"{name:<5} time-to-first-frame median {median(totals) * 1e3:7.1f} ms  "
+                  f"min {min(totals) * 1e3:7.1f} ms   Game() median {median(games) * 1e3:6.1f} ms  "
+                  f"loading frame after {median(loading) * 1e3:5.1f} ms  ({runs} runs)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# benchmarks/suite.py
+"""Benchmark suite: grid hot paths on fixed-seed boards, headless Simulation.step()
+throughput and GameUI frame rendering.
+
+Results are JSON (per benchmark: best and median microseconds per operation over
+--repeat runs; step/random also gives shots_per_s). They are compared against a stored
+baseline, and the exit status is 1 if any benchmark's best time regressed by more
+than --threshold.
+
+    python -m benchmarks.suite                       # run, compare with benchmarks/baseline.json
+    python -m benchmarks.suite --json out.json       # also write the results
+    python -m benchmarks.suite --update-baseline     # store this machine's results as the baseline
+
+Baselines are machine-specific: regenerate one before comparing on new hardware.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+from collections import deque
+from math import cos, sin, radians
+from statistics import median
+from time import perf_counter
+
+import pygame
+from config import *
+from audio import AudioManager
+from game_logic import Bubble, BubbleGrid
+from game_view import GameUI
+from simulation import Simulation
+from benchmarks.boards import BOARD_SIZES, make_board, occupied_cells
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+REPEAT = 5
+THRESHOLD = 0.25        # allowed slowdown of the best time before it counts as a regression
+MIN_SAMPLE = 0.05       # seconds of timed work per sample
+QUERIES = 200
+FRAMES = 120
+
+# --- grid benchmarks: each returns a callable that runs a batch and
+#     returns (seconds spent in the timed operation, operation count) ---
+
+def clone(grid, seed=0) -> BubbleGrid:
+    """Independent copy of grid's cells and parity with its own seeded RNG."""
+    copy = BubbleGrid(cols=grid.cols, rows=grid.rows, rng=random.Random(seed))
+    copy.codes = deque(bytearray(row) for row in grid.codes)
+    copy.row_offset = grid.row_offset
+    return copy
+
+def landing_spots(grid) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """(empty cell, occupied neighbour) pairs where a shot could come to rest."""
+    spots = []
+    for r in range(grid.rows):
+        for c in range(grid.cols):
+            if grid.codes[r][c]:
+                continue
+            hit = next((n for n in grid.neighbor_cells(r, c) if grid.codes[n[0]][n[1]]), None)
+            if hit is not None:
+                spots.append(((r, c), hit))
+    return spots
+
+def bench_match(grid):
+    starts = occupied_cells(grid, QUERIES)
+    def run():
+        t0 = perf_counter()
+        for r, c in starts:
+            grid.get_connected_same_color(r, c)
+        return perf_counter() - t0, len(starts)
+    return run
+
+def bench_floaters(grid):
+    def run():
+        t0 = perf_counter()
+        grid.enqueue_floating_bubbles(0)        # no seeds: full board scan
+        elapsed = perf_counter() - t0
+        grid.pops.clear()
+        return elapsed, 1
+    return run
+
+def bench_add_row(grid, boards=20):
+    def run():
+        copies = [clone(grid, seed) for seed in range(boards)]
+        t0 = perf_counter()
+        for copy in copies:
+            copy.add_row_to_top()
+        return perf_counter() - t0, boards
+    return run
+
+def bench_snap(grid):
+    spots = landing_spots(grid)[:QUERIES]
+    bubbles = [Bubble(BUBBLE_COLORS[i % len(BUBBLE_COLORS)], grid.get_position_for_cell(*cell))
+               for i, (cell, _) in enumerate(spots)]
+    def run():
+        board = clone(grid)
+        for bubble, (cell, _) in zip(bubbles, spots):
+            bubble.pos = board.get_position_for_cell(*cell)
+        t0 = perf_counter()
+        for bubble, (_, hit) in zip(bubbles, spots):
+            board.snap_bubble_to_grid(bubble, *hit)
+        return perf_counter() - t0, len(spots)
+    return run
+
+def bench_move(grid, probes=2000):
+    rng = random.Random(0)
+    starts = [(rng.uniform(GRID_LEFT_OFFSET, GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH),
+               rng.uniform(GRID_TOP_OFFSET, SHOOTER_Y)) for _ in range(probes)]
+    bubble = Bubble(BUBBLE_COLORS[0], starts[0])
+    velocity = (0.0, -PROJECTILE_SPEED)
+    def run():
+        t0 = perf_counter()
+        for pos in starts:
+            bubble.pos = pos
+            bubble.velocity = velocity
+            bubble.move(1 / FPS, grid)
+        return perf_counter() - t0, len(starts)
+    return run
+
+GRID_BENCHMARKS = [
+    ("match", bench_match),
+    ("floaters", bench_floaters),
+    ("add_row", bench_add_row),
+    ("snap", bench_snap),
+    ("move", bench_move),
+]
+
+# --- headless play: Simulation.step() at random angles, a new seeded game after each loss ---
+
+def bench_step(shots=100):
+    sim = Simulation(seed=0)
+    aim = random.Random(0)
+    def run():
+        angles = [aim.uniform(MIN_ANGLE, MAX_ANGLE) for _ in range(shots)]
+        t0 = perf_counter()
+        for angle in angles:
+            if not sim.step(angle):
+                sim.reset(aim.getrandbits(32))
+        return perf_counter() - t0, shots
+    return run
+
+# --- rendering: GameUI drawing a seeded mid-game board to an off-screen surface ---
+
+def bench_draw(dirty):
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))     # convert() needs a display format
+    target = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    ui = GameUI(target, AudioManager())
+    sim = Simulation(seed=1)
+    aim = random.Random(1)
+    for _ in range(12):
+        sim.step(aim.uniform(MIN_ANGLE, MAX_ANGLE))
+    warning = Bubble(color=GRAY, pos=(PREVIEW_X + 40, PREVIEW_Y))
+    draw = ui.draw_ui_dirty if dirty else ui.draw_ui
+    def run():
+        t0 = perf_counter()
+        for frame in range(FRAMES):
+            angle = MIN_ANGLE + (MAX_ANGLE - MIN_ANGLE) * frame / FRAMES    # sweep the arrow
+            mouse = (SHOOTER_X + 200 * cos(radians(angle)), SHOOTER_Y - 200 * sin(radians(angle)))
+            draw(sim.grid, sim.bubble, sim.next_bubble, warning, mouse, sim.game_over)
+        return perf_counter() - t0, FRAMES
+    return run
+
+# --- running and comparing ---
+
+def measure(run, repeat) -> dict:
+    run()                                       # warm-up: caches, lazily built tables
+    per_op = []
+    gc.collect()
+    gc.disable()                                # as timeit does: no collector pauses in the samples
+    try:
+        for _ in range(repeat):
+            elapsed = ops = 0
+            while elapsed < MIN_SAMPLE:             # batch short benchmarks into longer samples
+                t, n = run()
+                elapsed, ops = elapsed + t, ops + n
+            per_op.append(elapsed / ops * 1e6)
+    finally:
+        gc.enable()
+    return {"best_us": round(min(per_op), 3), "median_us": round(median(per_op), 3)}
+
+def run_suite(repeat=REPEAT) -> dict:
+    sys.setrecursionlimit(100_000)      # BubbleGrid's DFS recurses once per visited cell
+    results = {}
+    for size, rows, cols, filled, density in BOARD_SIZES:
+        grid = make_board(rows, cols, filled, density)
+        for name, bench in GRID_BENCHMARKS:
+            results[f"{name}/{size}"] = measure(bench(grid), repeat)
+
+    results["step/random"] = measure(bench_step(), repeat)
+    results["step/random"]["shots_per_s"] = round(1e6 / results["step/random"]["best_us"])
+
+    pygame.init()
+    results["draw_ui/full"] = measure(bench_draw(dirty=False), repeat)
+    results["draw_ui/dirty"] = measure(bench_draw(dirty=True), repeat)
+    pygame.quit()
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": f"{platform.system()} {platform.machine()}",
+        "repeat": repeat,
+        "results": results,
+    }
+
+def compare(current: dict, baseline: dict, threshold=THRESHOLD) -> list[str]:
+    """Print best-time ratios against baseline; return the names that regressed."""
+    regressions = []
+    base = baseline["results"]
+    for name, res in current["results"].items():
+        rate = f"   ({res['shots_per_s']:,} shots/s)" if "shots_per_s" in res else ""
+        if name not in base:
+            print(f"{name:<20} {res['best_us']:12.3f} us   (new){rate}", file=sys.stderr)
+            continue
+        ratio = res["best_us"] / base[name]["best_us"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<20} {res['best_us']:12.3f} us   baseline {base[name]['best_us']:12.3f} us"
+              f"   x{ratio:5.2f}{flag}{rate}", file=sys.stderr)
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[0])
+    parser.add_argument("--json", metavar="PATH", help="write results here (default: stdout)")
+    parser.add_argument("--baseline", metavar="PATH", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"allowed relative slowdown (default {THRESHOLD})")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with these results")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.repeat)
+    text = json.dumps(current, indent=2)
+    if args.json:
+        with open(args.json, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(text + "\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline", file=sys.stderr)
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(current, json.load(f), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+# bitboard.py
+from functools import lru_cache
+from config import *
+
+@lru_cache(maxsize=None)
+def board_masks(rows: int, cols: int):
+    """Precomputed masks for a rows x cols board (bit index = row * cols + col).
+
+    Returns (full, not_first_col, not_last_col, even_rows, odd_rows).
+    """
+    row_bits = (1 << cols) - 1
+    full = (1 << (rows * cols)) - 1
+    first_col = sum(1 << (r * cols) for r in range(rows))
+    last_col = first_col << (cols - 1)
+    even_rows = sum(row_bits << (r * cols) for r in range(0, rows, 2))
+    odd_rows = full & ~even_rows
+    return full, full & ~first_col, full & ~last_col, even_rows, odd_rows
+
+class BitBoard:
+    """Bitboard grid engine: one Python int per colour code plus an occupancy int.
+
+    Flood fills (matches, floaters) are a handful of shift-and-OR iterations.
+    Hex adjacency follows BubbleGrid.is_flush_left via precomputed row-parity masks.
+    """
+    __slots__ = ("rows", "cols", "colors", "occupied", "row_offset",
+                 "_full", "_not_first", "_not_last", "_even", "_odd")
+
+    def __init__(self, rows=GRID_ROWS, cols=GRID_COLS, row_offset=False):
+        self.rows = rows
+        self.cols = cols
+        self.colors: dict[int, int] = {}        # colour code -> bit mask
+        self.occupied = 0
+        self.row_offset = row_offset
+        self._full, self._not_first, self._not_last, self._even, self._odd = board_masks(rows, cols)
+
+    @classmethod
+    def from_bubble_grid(cls, grid) -> "BitBoard":
+        """Copy colours and parity out of a BubbleGrid."""
+        bb = cls(grid.rows, grid.cols, grid.row_offset)
+        for r, row in enumerate(grid.codes):
+            for c, code in enumerate(row):
+                if code:
+                    bb.set(r, c, code)
+        return bb
+
+    def copy(self) -> "BitBoard":
+        bb = BitBoard.__new__(BitBoard)
+        for name in BitBoard.__slots__:
+            setattr(bb, name, getattr(self, name))
+        bb.colors = dict(self.colors)
+        return bb
+
+    # cell access ---------------------------------------
+    def bit(self, row: int, col: int) -> int:
+        return 1 << (row * self.cols + col)
+
+    def set(self, row: int, col: int, code: int):
+        self.clear(row, col)
+        b = self.bit(row, col)
+        self.colors[code] = self.colors.get(code, 0) | b
+        self.occupied |= b
+
+    def clear(self, row: int, col: int):
+        b = self.bit(row, col)
+        if self.occupied & b:
+            for code, mask in self.colors.items():
+                if mask & b:
+                    self.colors[code] = mask & ~b
+                    break
+            self.occupied &= ~b
+
+    def get(self, row: int, col: int) -> int:
+        """Colour code at (row, col), 0 when empty."""
+        b = self.bit(row, col)
+        if self.occupied & b:
+            for code, mask in self.colors.items():
+                if mask & b:
+                    return code
+        return 0
+
+    def remove_mask(self, mask: int):
+        """Empty every cell in mask."""
+        keep = ~mask
+        self.occupied &= keep
+        for code in self.colors:
+            self.colors[code] &= keep
+
+    def cells(self, mask: int) -> list[tuple[int, int]]:
+        """(row, col) of each set bit in row-major order."""
+        out = []
+        cols = self.cols
+        while mask:
+            low = mask & -mask
+            i = low.bit_length() - 1
+            out.append(divmod(i, cols))
+            mask ^= low
+        return out
+
+    # flood fills ---------------------------------------
+    def dilate(self, mask: int) -> int:
+        """Return mask grown by one step to all six hex neighbours."""
+        cols = self.cols
+        flush, offset = (self._odd, self._even) if self.row_offset else (self._even, self._odd)
+        vert = ((mask << cols) | (mask >> cols)) & self._full
+        return (mask | vert
+                | ((mask << 1) & self._not_first) | ((mask >> 1) & self._not_last)
+                | ((vert << 1) & self._not_first & flush)       # flush rows: (r±1, c-1)
+                | ((vert >> 1) & self._not_last & offset))      # offset rows: (r±1, c+1)
+
+    def flood(self, seed: int, allowed: int) -> int:
+        """Grow seed within allowed until it stops changing."""
+        region = seed & allowed
+        while True:
+            grown = self.dilate(region) & allowed
+            if grown == region:
+                return region
+            region = grown
+
+    def connected(self, row: int, col: int) -> int:
+        """Mask of the same-colour component containing (row, col); 0 if the cell is empty."""
+        code = self.get(row, col)
+        if not code:
+            return 0
+        return self.flood(self.bit(row, col), self.colors[code])
+
+    def connected_same_color(self, row: int, col: int) -> list[tuple[int, int]]:
+        """Cells of the same-colour component in row-major order (same set as BubbleGrid's DFS)."""
+        return self.cells(self.connected(row, col))
+
+    def floating(self) -> int:
+        """Mask of occupied cells not connected to row 0."""
+        top = self.occupied & ((1 << self.cols) - 1)
+        return self.occupied & ~self.flood(top, self.occupied)
+
+    def floating_cells(self) -> list[tuple[int, int]]:
+        """Floaters bottom-up, left to right: the order enqueue_floating_bubbles queues them."""
+        return sorted(self.cells(self.floating()), key=lambda rc: (-rc[0], rc[1]))
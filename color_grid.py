@@ -0,0 +1,95 @@
+# color_grid.py
+import numpy as np
+from config import *
+
+class ColorGrid:
+    """NumPy grid backend: one int8 colour code per cell (0 = empty, see COLOR_CODES).
+
+    Match and floater detection run as iterative flood fills over whole-array
+    boolean masks; hex adjacency follows the same row_offset parity as BubbleGrid.
+    """
+    def __init__(self, rows=GRID_ROWS, cols=GRID_COLS, row_offset=False):
+        self.rows = rows
+        self.cols = cols
+        self.codes = np.zeros((rows, cols), dtype=np.int8)
+        self.row_offset = row_offset
+
+    @classmethod
+    def from_bubble_grid(cls, grid) -> "ColorGrid":
+        """Copy colours and parity out of a BubbleGrid."""
+        cg = cls(grid.rows, grid.cols, grid.row_offset)
+        for r, row in enumerate(grid.codes):
+            for c, code in enumerate(row):
+                if code:
+                    cg.codes[r, c] = code
+        return cg
+
+    @property
+    def row_offset(self) -> bool:
+        return self._row_offset
+
+    @row_offset.setter
+    def row_offset(self, value: bool):
+        self._row_offset = value
+        # (rows, 1) column: True where the row starts flush left
+        self._flush = ((np.arange(self.rows) % 2 == 0) != value)[:, None]
+
+    def is_flush_left(self, row: int) -> bool:
+        """Return True when the given row starts flush left (not offset)."""
+        return (row % 2 == 0) != self.row_offset
+
+    def dilate(self, mask: np.ndarray) -> np.ndarray:
+        """Return mask grown by one step to all six hex neighbours."""
+        out = mask.copy()
+        out[:, 1:] |= mask[:, :-1]
+        out[:, :-1] |= mask[:, 1:]
+
+        # rows above and below: same column, plus c-1 for flush rows or c+1 for offset rows
+        vert = np.zeros_like(mask)
+        vert[1:] |= mask[:-1]
+        vert[:-1] |= mask[1:]
+        out |= vert
+        out[:, 1:] |= vert[:, :-1] & self._flush
+        out[:, :-1] |= vert[:, 1:] & ~self._flush
+        return out
+
+    def flood(self, seed: np.ndarray, allowed: np.ndarray) -> np.ndarray:
+        """Grow seed within allowed until it stops changing."""
+        region = seed & allowed
+        while True:
+            grown = self.dilate(region) & allowed
+            if np.array_equal(grown, region):
+                return region
+            region = grown
+
+    def connected_mask(self, row: int, col: int) -> np.ndarray:
+        """Mask of the same-colour component containing (row, col); empty if the cell is."""
+        code = self.codes[row, col]
+        seed = np.zeros(self.codes.shape, dtype=bool)
+        if code == 0:
+            return seed
+        seed[row, col] = True
+        return self.flood(seed, self.codes == code)
+
+    def connected_same_color(self, row: int, col: int) -> list[tuple[int, int]]:
+        """Cells of the same-colour component in row-major order (same set as BubbleGrid's DFS)."""
+        rs, cs = np.nonzero(self.connected_mask(row, col))
+        return list(zip(rs.tolist(), cs.tolist()))
+
+    def floating_mask(self) -> np.ndarray:
+        """Mask of occupied cells not connected to row 0."""
+        occupied = self.codes != 0
+        seed = np.zeros_like(occupied)
+        seed[0] = occupied[0]
+        return occupied & ~self.flood(seed, occupied)
+
+    def floating_cells(self) -> list[tuple[int, int]]:
+        """Floaters bottom-up, left to right: the order enqueue_floating_bubbles queues them."""
+        mask = self.floating_mask()[::-1]
+        rs, cs = np.nonzero(mask)
+        return [(self.rows - 1 - r, c) for r, c in zip(rs.tolist(), cs.tolist())]
+
+    def remove(self, cells):
+        """Empty the given (row, col) cells."""
+        for r, c in cells:
+            self.codes[r, c] = 0
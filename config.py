@@ -6,14 +6,34 @@ SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 800
 TOOLBAR_HEIGHT = 100
 FPS = 120
+IDLE_PACING = True          # slow the loop down while nothing can change without input
+IDLE_AFTER_MS = 500         # how long the game must be idle before pacing kicks in
+IDLE_FPS = 0                # frame rate while idle; 0 blocks on input instead
+IDLE_WAIT_MS = 250          # with IDLE_FPS = 0: longest block before a frame runs anyway
+DIRTY_RECTS = True          # push only changed regions with display.update(rects)
+DIRTY_RECT_LIMIT = 16       # more dirty rects than this are merged into one
+TEXT_CACHE_SIZE = 64        # LRU capacity of rendered text surfaces
+PROFILE_FRAMES = 600        # frames kept by the frame profiler's ring buffer
+PROFILE_REFRESH_MS = 250    # profiler overlay redraw interval
+PROFILE_CSV = None          # path: write the profiler's frames there on exit
 
 PROJECTILE_SPEED = 500
+SIM_HZ = 120                # fixed simulation ticks per second, independent of FPS
+SIM_TICK = 1 / SIM_HZ
+MAX_FRAME_TICKS = 12        # ticks run per frame at most; a longer stall is dropped, not replayed
 
 # Colors (RGB)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 GRAY = (128, 128, 128)
 
+# Sprites
+BACKGROUND_PATH = "assets/sprites/frutiger_aero1.png"
+ARROW_PATH = "assets/sprites/arrow.png"
+BUBBLE_SPRITE = "assets/sprites/bubble_{}.png"      # formatted with the colour name
+REPORT_STARTUP = True       # print time to first frame / time to interactive
+ASSET_CACHE_DIR = ".asset_cache"    # atlas + prescaled background + hit masks; None loads the PNGs
+
 # Game Over Popup
 GAME_OVER_ASSETS = [
 ("popup", "assets/sprites/game_over.png"),
@@ -65,6 +85,9 @@ BUBBLE_COLOR_PAIRS = [
 ]
 
 BUBBLE_COLORS = [color for color, name in BUBBLE_COLOR_PAIRS if name != "gray"]
+# Compact colour codes for array/bit-level grids (0 = empty cell)
+COLOR_CODES = {color: code for code, (color, name) in enumerate(BUBBLE_COLOR_PAIRS, start=1)}
+CODE_COLORS = {code: color for color, code in COLOR_CODES.items()}
 
 STARTING_ROWS = 10
 # Grid
@@ -76,6 +99,10 @@ COL_WIDTH = (BUBBLE_RADIUS + 3) * 2
 ROW_HEIGHT = (BUBBLE_RADIUS + 3) * sqrt(3)
 
 DIRECTIONS = ["top_left", "top_right", "left", "right", "bottom_left", "bottom_right"]
+# (d_row, d_col) per DIRECTIONS entry, indexed by "row is flush left"
+NEIGHBOR_OFFSETS = {
+            True: [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)],
+            False: [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)]}
 REVERSE_DIR = {
             "left": "right", "right": "left",
             "top_left": "bottom_right", "bottom_right": "top_left",
@@ -93,6 +120,18 @@ SHOOTER_X = GRID_LEFT_OFFSET + FIELD_WIDTH // 2
 #Preview
 PREVIEW_Y = GRID_TOP_OFFSET + FIELD_HEIGHT + 2.5*ROW_HEIGHT
 PREVIEW_X = GRID_LEFT_OFFSET + COL_WIDTH*0.5
+# Autoplay (python main.py --autoplay)
+AUTOPLAY_ANGLES = 180       # candidate angles per shot, MIN_ANGLE..MAX_ANGLE
+AUTOPLAY_FOLLOW_ANGLES = 36 # angles tried for the preview bubble's follow-up (lookahead)
+AUTOPLAY_LOOKAHEAD = True
+AUTOPLAY_BUDGET_MS = 250    # longest a shot waits on its candidates
+AUTOPLAY_WORKERS = 0        # evaluation processes; 0 = one per CPU
+AUTOPLAY_RESTART_MS = 2000  # game-over screen time before the bot starts a new game
+# Save on exit: the unfinished game is stored here and resumed on the next start (None: off)
+SAVE_PATH = "savegame.bin"
+# Replays
+RECORD_REPLAYS = False      # save every finished game to REPLAY_DIR
+REPLAY_DIR = "replays"
 
 # Sounds and music
 CLICK_SOUND_PATH = "assets/sounds/click.wav"
@@ -102,6 +141,8 @@ POP_SOUND_PATHS = [
     "assets/sounds/pop_3.wav"
 ]
 PLOP_SOUND_PATH = "assets/sounds/plop.wav"
+SFX_CHANNELS = 8            # mixer channels reserved for effects; also the voice limit
+CASCADE_LAYERS = 3          # most voices one frame's burst of the same effect may take
 TRACKS = ["assets/sounds/cloud_jumper.ogg",
          "assets/sounds/lotus_waters.ogg",
          "assets/sounds/lease-extended.ogg",
@@ -117,5 +158,8 @@ TITLES = ["Cloud Jumper.mp3",
 ARROW_LEN      = 70        # pixels visible outside the shooter bubble
 ARROW_COLOR    = (150, 233, 255, 70)
 ARROW_THICK    = 6
+ARROW_ANGLE_STEP  = 0.5    # degrees between cached arrow rotations
+ARROW_CACHE_SIZE  = 128    # LRU capacity of lazily rotated frames
+ARROW_PRELOAD     = False  # True: render every frame of MIN_ANGLE..MAX_ANGLE at startup
 MIN_ANGLE = degrees(atan2(SHOOTER_Y - GRID_TOP_OFFSET - FIELD_HEIGHT, GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH - SHOOTER_X))
 MAX_ANGLE = degrees(atan2(SHOOTER_Y - GRID_TOP_OFFSET - FIELD_HEIGHT, GRID_LEFT_OFFSET - SHOOTER_X))
\ No newline at end of file
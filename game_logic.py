@@ -1,36 +1,173 @@
 # game_logic.py
-import pygame
+import heapq
+import struct
+from collections import deque
+from functools import lru_cache
+from itertools import count
+from math import hypot
 from config import *
 import random as rand
 
+class ManualClock:
+    """Millisecond clock advanced by hand; default time source for headless grids."""
+    def __init__(self, now: int = 0):
+        self.now = now
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, ms: int) -> int:
+        self.now += ms
+        return self.now
+
+class GameRandom(rand.Random):
+    """random.Random that counts the 32-bit words it has drawn.
+
+    Its state is then just (seed, draws): GameRandom(seed).skip(draws) rebuilds it,
+    where getstate() would take 2.5 KB. The stream is the same as random.Random(seed).
+    """
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.draws = 0
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def random(self) -> float:
+        self.draws += 2
+        return super().random()
+
+    def choice(self, seq):
+        """random.Random.choice with the word count kept inline (the same draws, fewer
+        calls: board generation makes one per cell)."""
+        n = len(seq)
+        if not n:
+            raise IndexError("Cannot choose from an empty sequence")
+        getrandbits = super().getrandbits
+        k = n.bit_length()
+        r = getrandbits(k)
+        words = 1
+        while r >= n:
+            r = getrandbits(k)
+            words += 1
+        self.draws += words * ((k + 31) // 32)
+        return seq[r]
+
+    def skip(self, words: int):
+        """Advance the stream by words 32-bit draws in one call."""
+        if words:
+            super().getrandbits(32 * words)
+            self.draws += words
+
+class PopScheduler:
+    """Pending pops ordered by due tick (ms), with batches and cancellation.
+
+    Items are grid cells (row, col); any hashable works.
+    """
+    def __init__(self):
+        self._heap: list[list] = []             # [due, seq, item]; item None once cancelled
+        self._entries: dict = {}                # live entry per item
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def schedule(self, item, due):
+        """Queue item to pop at tick due (rescheduling it if already queued)."""
+        self.cancel(item)
+        entry = [due, next(self._seq), item]
+        self._entries[item] = entry
+        heapq.heappush(self._heap, entry)
+
+    def schedule_batch(self, items, start, interval):
+        """Queue items to pop one after another: start, start + interval, ..."""
+        for i, item in enumerate(items):
+            self.schedule(item, start + i * interval)
+
+    def cancel(self, item) -> bool:
+        """Drop item's pending pop; return True if it was queued."""
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return False
+        entry[2] = None
+        return True
+
+    def clear(self):
+        """Cancel every pending pop (restart)."""
+        self._heap.clear()
+        self._entries.clear()
+
+    def next_due(self):
+        """Tick of the earliest pending pop, or None."""
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now) -> list:
+        """Remove and return the items due at or before now, in due order."""
+        due = []
+        heap = self._heap
+        while heap and (heap[0][2] is None or heap[0][0] <= now):
+            _, _, item = heapq.heappop(heap)
+            if item is not None:
+                del self._entries[item]
+                due.append(item)
+        return due
+
+    def drain(self) -> list:
+        """Fast-forward: remove and return every pending item in due order."""
+        return self.pop_due(float("inf"))
+
+    def pending(self) -> list:
+        """Pending items in due order, without removing them."""
+        return [e[2] for e in sorted(self._entries.values())]
+
+# rows, cols, row_offset, score, non-clearing count, non-clearing threshold, rows added;
+# then one colour code per cell, top row first
+GRID_SNAPSHOT = struct.Struct("<HHBIHHI")
+
+def _ignore_event(name: str) -> None:
+    """Default event sink: drop grid events (no audio in headless runs)."""
+
 class Bubble:
-    def __init__(self, color, pos, velocity=pygame.Vector2(0, 0), radius=BUBBLE_RADIUS):
-        """Create a bubble with color, position, velocity, radius and empty neighbour map."""
+    """A free bubble: the projectile, the preview or a HUD marker.
+
+    Bubbles resting in a BubbleGrid are not objects, just colour codes in the grid.
+    """
+    __slots__ = ("color", "radius", "pos", "velocity", "hit_cell")
+
+    def __init__(self, color, pos, velocity=(0.0, 0.0), radius=BUBBLE_RADIUS):
+        """Create a bubble with color, position, velocity and radius."""
         self.color = color
         self.radius = radius
-        self.pos = pygame.Vector2(pos)       # Accepts tuple or Vector2
-        self.velocity = pygame.Vector2(velocity)
-        self.cell: tuple[int, int] | None = None
-        self.neighbors = {direction : None for direction in DIRECTIONS}
+        self.pos = (float(pos[0]), float(pos[1]))               # Accepts any (x, y) pair
+        self.velocity = (float(velocity[0]), float(velocity[1]))
+        self.hit_cell: tuple[int, int] | None = None            # set by move() on collision
+
+    def is_moving(self) -> bool:
+        """Return True while the bubble has a non-zero velocity."""
+        return self.velocity != (0.0, 0.0)
 
     def check_collision_with_neighbors(self, grid) -> bool:
         """Return True if this bubble overlaps any neighbour or its own cell area."""
         row, col = grid.get_cell_for_position(*self.pos)
         collision_radius_sq = (2 * (self.radius-2)) ** 2
 
-        candidates = [(row, col)]
-
-        neighbors = grid.get_neighbor_coords(row, col)
-        for _, n_row, n_col in neighbors:
-            candidates.append((n_row, n_col))
+        x, y = self.pos
+        if 0 <= row < grid.rows and grid.codes[row][col]:
+            ox, oy = grid.get_position_for_cell(row, col)
+            if (x - ox) ** 2 + (y - oy) ** 2 <= collision_radius_sq:
+                return True
 
-        for r, c in candidates:
-            if not (0 <= r < grid.rows and 0 <= c < grid.cols):
+        for r, c in grid.neighbor_cells(row, col):
+            if not grid.codes[r][c]:
                 continue
-            other = grid.bubbles[r][c]
-            if other is None:
-                continue
-            if (self.pos - other.pos).length_squared() <= collision_radius_sq:
+            ox, oy = grid.get_position_for_cell(r, c)
+            if (x - ox) ** 2 + (y - oy) ** 2 <= collision_radius_sq:
                 return True
 
         return False
@@ -38,66 +175,113 @@ class Bubble:
     def first_colliding_cell(self, grid):
         """Locate the first grid cell whose bubble collides with this one."""
         row, col = grid.get_cell_for_position(*self.pos)
-        for _, r, c in grid.get_neighbor_coords(row, col):
-            other = grid.bubbles[r][c]
-            if other and (self.pos - other.pos).length_squared() <= (2*(self.radius-2))**2:
-                return r, c
+        x, y = self.pos
+        for r, c in grid.neighbor_cells(row, col):
+            if grid.codes[r][c]:
+                ox, oy = grid.get_position_for_cell(r, c)
+                if (x - ox) ** 2 + (y - oy) ** 2 <= (2*(self.radius-2))**2:
+                    return r, c
         return row, col   
 
     def move(self, delta_time, grid):
         """Advance bubble by velocity, reflect or stop on wall / collision, and mark hit cell."""
-        self.pos += self.velocity * delta_time
+        old_x, old_y = self.pos
+        vx, vy = self.velocity
+        self.pos = (old_x + vx * delta_time, old_y + vy * delta_time)
 
         if self.check_collision_with_neighbors(grid):
-            self.pos -= self.velocity * delta_time
-            self.velocity = pygame.Vector2(0, 0)
+            self.pos = (old_x, old_y)
+            self.velocity = (0.0, 0.0)
             self.hit_cell = self.first_colliding_cell(grid)
             return None
 
-        if self.pos.x - self.radius <= GRID_LEFT_OFFSET or self.pos.x + self.radius >= GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH:
-            self.velocity.x *= -1
+        x, y = self.pos
+        if x - self.radius <= GRID_LEFT_OFFSET or x + self.radius >= GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH:
+            vx = -vx
             # Clamp position inside the screen so it doesn't stick outside
-            self.pos.x = max(self.radius + GRID_LEFT_OFFSET, min(GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH - self.radius, self.pos.x))
-
-        if self.pos.y - self.radius <= GRID_TOP_OFFSET:
-            self.velocity = pygame.Vector2(0, 0)
-            self.pos.y = GRID_TOP_OFFSET + ROW_HEIGHT//2
+            x = max(self.radius + GRID_LEFT_OFFSET, min(GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH - self.radius, x))
+            self.pos = (x, y)
+            self.velocity = (vx, vy)
+
+        if y - self.radius <= GRID_TOP_OFFSET:
+            self.velocity = (0.0, 0.0)
+            self.pos = (x, GRID_TOP_OFFSET + ROW_HEIGHT//2)
+
+@lru_cache(maxsize=None)
+def cell_tables(rows: int, cols: int):
+    """Neighbour and cell-centre tables for a board size, shared by every grid of that size.
+
+    Returns (neighbor_coords, neighbor_cells, positions), each a pair indexed by
+    "row is flush left". Neighbour tables are indexed [row + 1][col] and also cover
+    rows -1 and rows, so a projectile just outside the grid still finds its in-grid
+    neighbours; position tables are indexed [row][col]. Entries are immutable tuples.
+    """
+    neighbor_coords, neighbor_cells, positions = ([], []), ([], []), ([], [])
+    for flush in (False, True):
+        offset = 0.5 if flush else 1.0
+        for row in range(rows):
+            y = GRID_TOP_OFFSET + (row + 0.5) * ROW_HEIGHT
+            positions[flush].append(tuple((GRID_LEFT_OFFSET + (col + offset) * COL_WIDTH, y)
+                                          for col in range(cols)))
+
+        dir_vectors = NEIGHBOR_OFFSETS[flush]
+        for row in range(-1, rows + 1):
+            coords_row, cells_row = [], []
+            for col in range(cols):
+                coords = tuple((name, row + dr, col + dc)
+                               for (dr, dc), name in zip(dir_vectors, DIRECTIONS)
+                               if 0 <= row + dr < rows and 0 <= col + dc < cols)
+                coords_row.append(coords)
+                cells_row.append(tuple((r, c) for _, r, c in coords))
+            neighbor_coords[flush].append(tuple(coords_row))
+            neighbor_cells[flush].append(tuple(cells_row))
+    return neighbor_coords, neighbor_cells, positions
 
 class BubbleGrid:
-    def __init__(self, audio, cols=GRID_COLS, rows=GRID_ROWS):
-        """Prepare empty grid, state counters, score, audio link and pop-animation queue."""
-        self.audio = audio
-        self.rows = rows
-        self.cols = cols
-        self.bubbles: list[list[Bubble | None]] = [[None] * self.cols for _ in range(self.rows)]
-        self.pop_queue: list[Bubble] = []   # bubbles waiting to pop
+    def __init__(self, events=None, clock=None, cols=GRID_COLS, rows=GRID_ROWS, rng=None):
+        """Prepare empty grid, state counters, score, event sink, clock and pop-animation queue.
+
+        events: callable taking an event name ("pop", "plop"); clock: callable returning ms;
+        rng: random.Random drawing new bubble colours (default: the global random module).
+        """
+        self.events = events if events is not None else _ignore_event
+        self.clock = clock if clock is not None else ManualClock()
+        self.rng = rng if rng is not None else rand
+        self._rows = rows
+        self._cols = cols
+        self._load_cell_tables()
+        # one colour code per cell (COLOR_CODES, 0 = empty) in a circular row buffer:
+        # row insertion rotates it instead of copying every row
+        self.codes: deque[bytearray] = deque(bytearray(self.cols) for _ in range(self.rows))
+        self.pops = PopScheduler()          # cells waiting to pop, by due tick
         self.pop_interval = 100
-        self.next_pop_time = 0              # timestamp of next pop
         self.pending_floater_check = False  # run floater DFS when chain gone
+        self.floater_seeds: list[tuple[int, int]] | None = None  # cells emptied by the pending chain
         self.non_clearing_count = 0         # shots since last row addition
         self.non_clearing_threshold  = 5
         self.score = 0
         self._floaters_scoring = False      # flag: next enqueue_floating_bubbles gives points
         self.row_offset = False             # flag: indicates if the first row should be flush left or right
-
-    def remove_bubble(self, bubble):
-        """Detach bubble from grid and neighbour links, leaving its cell empty."""
-        if not bubble.cell:
-            print("⚠️ Tried to remove bubble without valid cell")
+        self.revision = 0                   # bumped on every cell change (renderer cache key)
+        self.rows_added = 0                 # rows inserted by add_row_to_top
+
+    def color_at(self, row: int, col: int):
+        """Colour of the bubble resting at (row, col), or None for an empty cell."""
+        code = self.codes[row][col]
+        return CODE_COLORS[code] if code else None
+
+    def remove_cell(self, row: int, col: int):
+        """Empty the cell at (row, col)."""
+        if not self.codes[row][col]:
+            print(f"⚠️ Tried to remove empty cell ({row}, {col})")
             return
-        row, col = bubble.cell
-
-        for direction, neighbor in bubble.neighbors.items():
-            if neighbor:
-                neighbor.neighbors[REVERSE_DIR[direction]] = None
-        bubble.neighbors = {k: None for k in bubble.neighbors}
-        self.bubbles[row][col] = None
-        bubble.cell = None
+        self.codes[row][col] = 0
+        self.revision += 1
 
     def destroy_bubbles(self, match_chain: list[tuple[int, int]]):
         """Score and enqueue a colour-match chain; play plop if chain too short."""
         if len(match_chain) < 3:
-            self.audio.play_plop()
+            self.events("plop")
             return self.register_non_clearing_shot()
         
         n = len(match_chain)
@@ -108,13 +292,10 @@ class BubbleGrid:
             chain_pts = 30 + 20 * ((2 ** (n - 3)) - 1)
         self.score += chain_pts
 
-        for row, col in match_chain:
-            bubble = self.bubbles[row][col]
-            if bubble:
-                self.pop_queue.append(bubble)
-
-        self.next_pop_time = pygame.time.get_ticks() + self.pop_interval
+        chain = [(row, col) for row, col in match_chain if self.codes[row][col]]
+        self.pops.schedule_batch(chain, self.clock() + self.pop_interval, self.pop_interval)
         self.pending_floater_check = True
+        self.floater_seeds = list(match_chain)
         self._floaters_scoring = True
         return True
     
@@ -132,37 +313,60 @@ class BubbleGrid:
         col = max(0, min(self.cols - 1, col))
         return row, col
     
-    def get_position_for_cell(self, row: int, col: int) -> pygame.Vector2:
+    def get_position_for_cell(self, row: int, col: int) -> tuple[float, float]:
         """Get the center of the cell at row, col."""
+        if 0 <= row < self._rows and 0 <= col < self._cols:
+            return self._positions[(row % 2 == 0) != self.row_offset][row][col]
+        return self._compute_position(row, col)
+
+    def _compute_position(self, row: int, col: int) -> tuple[float, float]:
         y = GRID_TOP_OFFSET + (row + 0.5) * ROW_HEIGHT
         if self.is_flush_left(row):
             x = GRID_LEFT_OFFSET + (col + 0.5) * COL_WIDTH
         else:
             x = GRID_LEFT_OFFSET + (col + 1) * COL_WIDTH
-        return pygame.Vector2(x, y)
+        return (x, y)
     
     def populate_random_rows(self, num_rows=STARTING_ROWS, colors=BUBBLE_COLORS):
         """Fill the top part of the grid with random-colour bubbles."""
         for row in range(num_rows):
+            codes = self.codes[row]
             for col in range(self.cols):
-                pos = self.get_position_for_cell(row, col)
-                color = rand.choice(colors)
-                bubble = Bubble(color, pos)
-                self.add_bubble(bubble)
+                codes[col] = COLOR_CODES[self.rng.choice(colors)]
+        self.revision += 1
     
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @rows.setter
+    def rows(self, value: int):
+        self._rows = value
+        self._load_cell_tables()
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @cols.setter
+    def cols(self, value: int):
+        self._cols = value
+        self._load_cell_tables()
+
+    def _load_cell_tables(self):
+        self._neighbor_coords, self._neighbor_cells, self._positions = cell_tables(self._rows, self._cols)
+
     def get_neighbor_coords(self, row, col):
-        """Yields 6 neighbour coordinates with direction names for a cell."""
-        if self.is_flush_left(row):
-            dir_vectors = [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)]
-        else:
-            dir_vectors = [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)]
-            
-        result = []
-        for (dr, dc), name in zip(dir_vectors, DIRECTIONS):
-            n_row, n_col = row + dr, col + dc
-            if 0 <= n_row < self.rows and 0 <= n_col < self.cols:
-                result.append((name, n_row, n_col))
-        return result
+        """Return the in-bounds neighbours of a cell as (direction, row, col) tuples."""
+        if -1 <= row <= self._rows and 0 <= col < self._cols:
+            return self._neighbor_coords[(row % 2 == 0) != self.row_offset][row + 1][col]
+        return ()
+
+    def neighbor_cells(self, row, col):
+        """Direction-free get_neighbor_coords: in-bounds neighbours as (row, col) tuples."""
+        if -1 <= row <= self._rows and 0 <= col < self._cols:
+            return self._neighbor_cells[(row % 2 == 0) != self.row_offset][row + 1][col]
+        return ()
     
     def find_closest_valid_cell(self, target_pos, candidate_cells):
         """Pick nearest empty candidate cell to a target position."""
@@ -172,11 +376,11 @@ class BubbleGrid:
         for row, col in candidate_cells:
             if not (0 <= row < self.rows and 0 <= col < self.cols):
                 continue
-            if self.bubbles[row][col] is not None:
+            if self.codes[row][col]:
                 continue
 
-            cell_pos = self.get_position_for_cell(row, col)
-            dist_sq = (target_pos - cell_pos).length_squared()
+            cell_x, cell_y = self.get_position_for_cell(row, col)
+            dist_sq = (target_pos[0] - cell_x) ** 2 + (target_pos[1] - cell_y) ** 2
 
             if dist_sq < min_dist_sq:
                 min_dist_sq = dist_sq
@@ -194,9 +398,7 @@ class BubbleGrid:
         if not (0 <= anchor_row < self.rows and 0 <= anchor_col < self.cols):
             return None
         
-        candidates = [(anchor_row, anchor_col)]
-        candidates += [(r, c) for _, r, c
-                    in self.get_neighbor_coords(anchor_row, anchor_col)]
+        candidates = ((anchor_row, anchor_col),) + self.neighbor_cells(anchor_row, anchor_col)
         
         self._debug_snap_info(anchor_row, anchor_col, bubble.pos)
 
@@ -209,29 +411,20 @@ class BubbleGrid:
         return target
 
     def add_bubble(self, bubble):
-        """Place bubble in grid, set its cell, relink neighbours; ignore out-of-bounds."""
+        """Store bubble's colour in the cell under its position; ignore out-of-bounds."""
         row, col = self.get_cell_for_position(*bubble.pos)
 
         if not (0 <= row < self.rows and 0 <= col < self.cols):
             print(f"⚠️ Ignoring out-of-bounds snap at row={row}, col={col}")
             return
-        if 0 <= col < self.cols and 0 <= row < self.rows:
-            bubble.pos = self.get_position_for_cell(row, col)
-            bubble.cell = (row, col)
-            self.bubbles[row][col] = bubble
-
-        neighbors = self.get_neighbor_coords(row, col)
-        for direction, n_row, n_col in neighbors:
-            neighbor = self.bubbles[n_row][n_col]
-            if neighbor:
-                bubble.neighbors[direction] = neighbor
-                reverse_dir = REVERSE_DIR[direction]
-                neighbor.neighbors[reverse_dir] = bubble
+        self.codes[row][col] = COLOR_CODES[bubble.color]
+        self.revision += 1
+
         DEBUG = False
         if DEBUG:
             print(f"Added bubble at ({row}, {col})")
-            for k, v in bubble.neighbors.items():
-                if v:
+            for k, r, c in self.get_neighbor_coords(row, col):
+                if self.codes[r][c]:
                     print(f" - {k}: neighbor exists")
 
     def get_connected_same_color(self, start_row, start_col):
@@ -239,74 +432,114 @@ class BubbleGrid:
         visited = set()
         result = []
 
-        def dfs(row, col, target_color):
+        def dfs(row, col, target_code):
             if (row, col) in visited:
                 return
             visited.add((row, col))
 
-            bubble = self.bubbles[row][col]
-            if not bubble or bubble.color != target_color:
+            if self.codes[row][col] != target_code:
                 return
 
             result.append((row, col))
 
-            for _, n_row, n_col in self.get_neighbor_coords(row, col):
-                if 0 <= n_row < self.rows and 0 <= n_col < self.cols:
-                    dfs(n_row, n_col, target_color)
+            for n_row, n_col in self.neighbor_cells(row, col):
+                dfs(n_row, n_col, target_code)
 
-        start_bubble = self.bubbles[start_row][start_col]
-        if start_bubble:
-            dfs(start_row, start_col, start_bubble.color)
+        start_code = self.codes[start_row][start_col]
+        if start_code:
+            dfs(start_row, start_col, start_code)
 
         return result
     
-    def enqueue_floating_bubbles(self):
-        """Mark and enqueue bubbles not connected to top row for popping and scoring."""
+    def enqueue_floating_bubbles(self, start=None):
+        """Mark and schedule bubbles not connected to top row for popping and scoring.
+
+        Floaters pop one per pop_interval from start (default: one interval from now).
+        """
+        if start is None:
+            start = self.clock() + self.pop_interval
+        # schedule floaters (bottom-up for nicer effect)
+        floaters = self.find_floaters(self.floater_seeds)
+        if self._floaters_scoring:
+            self.score += 100 * len(floaters)
+        self.pops.schedule_batch(floaters, start, self.pop_interval)
+        self.floater_seeds = None
+        self._floaters_scoring = False
+
+    def find_floaters(self, removed=None) -> list[tuple[int, int]]:
+        """Return occupied cells not connected to the top row, bottom-up and left to right.
+
+        With removed (cells just emptied by a match), only the components next to those
+        cells are searched; each search stops as soon as it reaches row 0. This relies on
+        the board having no floaters before the removal. Without removed, scan the whole board.
+        """
+        if removed is None:
+            return self._find_floaters_full()
+
+        anchored: set[tuple[int, int]] = set()
+        floating: set[tuple[int, int]] = set()
+        for row, col in removed:
+            for start in self.neighbor_cells(row, col):
+                if not self.codes[start[0]][start[1]] or start in anchored or start in floating:
+                    continue
+                seen = {start}
+                stack = [start]
+                reaches_top = False
+                while stack and not reaches_top:
+                    r, c = stack.pop()
+                    if r == 0:
+                        reaches_top = True
+                        break
+                    # pushed bottom-first so upward neighbours are explored first
+                    for cell in reversed(self.neighbor_cells(r, c)):
+                        if cell in seen or not self.codes[cell[0]][cell[1]]:
+                            continue
+                        if cell in anchored:
+                            reaches_top = True
+                            break
+                        seen.add(cell)
+                        stack.append(cell)
+                (anchored if reaches_top else floating).update(seen)
+
+        return sorted(floating, key=lambda rc: (-rc[0], rc[1]))
+
+    def _find_floaters_full(self) -> list[tuple[int, int]]:
+        """Full scan: DFS from every occupied top-row cell, report everything unreached."""
         visited: set[tuple[int, int]] = set()
         def dfs(row, col):
             if (row, col) in visited:
                 return
             visited.add((row, col))
-            for _, r2, c2 in self.get_neighbor_coords(row, col):
-                if self.bubbles[r2][c2]:
+            for r2, c2 in self.neighbor_cells(row, col):
+                if self.codes[r2][c2]:
                     dfs(r2, c2)
 
         for col in range(self.cols):
-            if self.bubbles[0][col]:
+            if self.codes[0][col]:
                 dfs(0, col)
 
-        # enqueue floaters (scans bottom-up for nicer effect)
-        for r in reversed(range(self.rows)):
-            for c in range(self.cols):
-                bub = self.bubbles[r][c]
-                if bub and (r, c) not in visited:
-                    if self._floaters_scoring:
-                        self.score += 100
-                    self.pop_queue.append(bub)
-        self._floaters_scoring = False
+        return [(r, c) for r in reversed(range(self.rows)) for c in range(self.cols)
+                if self.codes[r][c] and (r, c) not in visited]
 
     def add_row_to_top(self):
-        """Push grid down one row and insert a new random row at top; return False on overflow."""
-        for col in range(self.cols):
-            if self.bubbles[self.rows-1][col] is not None:
-                return False
-        # Shift all existing rows down by 1
-        for row in reversed(range(self.rows - 1)):
-            for col in range(self.cols):
-                self.bubbles[row + 1][col] = self.bubbles[row][col]
-                bubble = self.bubbles[row + 1][col]
-                if bubble:
-                    bubble.cell = (row + 1, col)
-        
-        # Insert a new random row at the top (row 0)
-        for col in range(self.cols):
-            color = rand.choice(BUBBLE_COLORS)
-            new_bubble = Bubble(color, pos = self.get_position_for_cell(0, col))
-            self.bubbles[0][col] = new_bubble
+        """Push grid down one row and insert a new random row at top; return False on overflow.
+
+        Rotates the row buffer: only the new row is written. Flipping the parity together
+        with the shift keeps every existing row's horizontal alignment.
+        """
+        bottom = self.codes[-1]
+        if any(bottom):
+            return False
 
-        # After insertion, relink neighbors
+        self.codes.pop()
+        self.codes.appendleft(bottom)
         self.row_offset = not self.row_offset
-        self.update_all_bubbles()
+        self.rows_added += 1
+
+        # Insert a new random row at the top (row 0)
+        for col in range(self.cols):
+            bottom[col] = COLOR_CODES[self.rng.choice(BUBBLE_COLORS)]
+        self.revision += 1
         return True
     
     def register_non_clearing_shot(self) -> bool:
@@ -326,33 +559,62 @@ class BubbleGrid:
         return True
 
     def update(self, now):
-        """Process queued pops over time and handle floating-bubble checks."""
-        while self.pop_queue and now >= self.next_pop_time:
-            bubble = self.pop_queue.pop(0)
-            self.remove_bubble(bubble)
-            self.audio.play_pop()
-            self.next_pop_time += self.pop_interval
-
-        if self.pending_floater_check and not self.pop_queue:
-            self.enqueue_floating_bubbles()
+        """Process scheduled pops that are due and handle floating-bubble checks."""
+        for row, col in self.pops.pop_due(now):
+            self.remove_cell(row, col)
+            self.events("pop")
+
+        if self.pending_floater_check and not self.pops:
+            self.enqueue_floating_bubbles(now + self.pop_interval)
             self.pending_floater_check = False
-            if self.pop_queue:
-                self.next_pop_time = now + self.pop_interval
 
-    def update_all_bubbles(self):
-        """Refresh every bubble’s cell, position and neighbour links after big shifts."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                bubble = self.bubbles[row][col]
-                if bubble:
-                    bubble.cell = (row, col)
-                    bubble.pos = self.get_position_for_cell(row, col)
-                    bubble.neighbors = {k: None for k in bubble.neighbors}
-                    neighbors = self.get_neighbor_coords(row, col)
-                    for direction, n_row, n_col in neighbors:
-                        neighbor = self.bubbles[n_row][n_col]
-                        if neighbor:
-                            bubble.neighbors[direction] = neighbor
+    def flush_pops(self):
+        """Fast-forward: resolve every scheduled pop and floater drop immediately (headless shots)."""
+        while self.pops or self.pending_floater_check:
+            for row, col in self.pops.drain():
+                self.remove_cell(row, col)
+                self.events("pop")
+            if self.pending_floater_check:
+                self.enqueue_floating_bubbles()
+                self.pending_floater_check = False
+
+    def is_settled(self) -> bool:
+        """True when no pops or floater checks are pending."""
+        return not self.pops and not self.pending_floater_check
+
+    def snapshot(self) -> bytes:
+        """Cells, parity, score and row counters as bytes (GRID_SNAPSHOT header + one
+        byte per cell). Pending pops are not included: take it on a settled grid."""
+        return GRID_SNAPSHOT.pack(self.rows, self.cols, self.row_offset, self.score, self.non_clearing_count,
+                                  self.non_clearing_threshold, self.rows_added) + b"".join(self.codes)
+
+    def restore(self, data):
+        """Load a snapshot() into this grid (resizing it if needed), dropping pending pops."""
+        rows, cols, row_offset, score, count, threshold, rows_added = GRID_SNAPSHOT.unpack_from(data)
+        if len(data) != GRID_SNAPSHOT.size + rows * cols:
+            raise ValueError(f"grid snapshot truncated: expected {rows}x{cols} cells")
+        if (rows, cols) != (self.rows, self.cols):
+            self._rows, self._cols = rows, cols
+            self._load_cell_tables()
+        cells = memoryview(data)[GRID_SNAPSHOT.size:]
+        self.codes = deque(bytearray(cells[r * cols:(r + 1) * cols]) for r in range(rows))
+        self.row_offset = bool(row_offset)
+        self.score = score
+        self.non_clearing_count = count
+        self.non_clearing_threshold = threshold
+        self.rows_added = rows_added
+        self.pops.clear()
+        self.pending_floater_check = False
+        self.floater_seeds = None
+        self._floaters_scoring = False
+        self.revision += 1
+
+    @classmethod
+    def from_snapshot(cls, data, events=None, clock=None, rng=None) -> "BubbleGrid":
+        rows, cols = GRID_SNAPSHOT.unpack_from(data)[:2]
+        grid = cls(events=events, clock=clock, cols=cols, rows=rows, rng=rng)
+        grid.restore(data)
+        return grid
 
     def _debug_snap_info(self, anchor_row, anchor_col,
                          bubble_pos, DEBUG_SNAP = False):
@@ -364,14 +626,15 @@ class BubbleGrid:
             f"  bubble-stop @ {bubble_pos}")
 
         for name, r, c in self.get_neighbor_coords(anchor_row, anchor_col):
-            centre = self.get_position_for_cell(r, c)
-            dist   = (centre - bubble_pos).length()
-            occ    = "OCC" if self.bubbles[r][c] else "   "
+            cx, cy = self.get_position_for_cell(r, c)
+            dist   = hypot(cx - bubble_pos[0], cy - bubble_pos[1])
+            occ    = "OCC" if self.codes[r][c] else "   "
             print(f"  {name:<13} cell=({r:2},{c:2})  {occ}  dist={dist:6.1f}")
 
 def compute_velocity(start_pos, target_pos, speed):
     """Return a unit-direction vector scaled to speed from start to target position."""
-    direction = pygame.Vector2(target_pos) - pygame.Vector2(start_pos)
-    if direction.length() == 0:
-        return pygame.Vector2(0, 0)
-    return direction.normalize() * speed
\ No newline at end of file
+    dx, dy = target_pos[0] - start_pos[0], target_pos[1] - start_pos[1]
+    length = hypot(dx, dy)
+    if length == 0:
+        return (0.0, 0.0)
+    return (dx / length * speed, dy / length * speed)
\ No newline at end of file
@@ -2,105 +2,113 @@
 import pygame
 from config import *
 from audio import AudioManager
-from math import atan2, degrees
+from assets import load_assets
+from math import atan2, degrees, ceil
+from collections import OrderedDict
+from time import perf_counter
+
+def load_fonts() -> dict[str, pygame.font.Font]:
+    """The UI fonts by role; needs only pygame.font, so it may run on a loader thread."""
+    return {
+        "text": pygame.font.Font("assets/Arcade.ttf", 27),
+        "score": pygame.font.Font("assets/Arcade.ttf", 52),
+        "track": pygame.font.Font("assets/Arcade.ttf", 16),
+        "debug": pygame.font.Font(None, 24)
+    }
 
 #GameUI class
 class GameUI:
-    def __init__(self, screen, audio: AudioManager):
-        """Load/create/set up UI assets."""
+    def __init__(self, screen, audio: AudioManager, assets=None, fonts=None):
+        """Load/create/set up UI assets (assets and fonts are loaded here unless given)."""
         self.screen = screen
         self.audio = audio
 
-        self.bg_img = pygame.image.load("assets/sprites/frutiger_aero1.png").convert()
-        self.bg_img = pygame.transform.scale(self.bg_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.assets = assets if assets is not None else load_assets()
+        self.bg_img = self.assets.background
         self.field_surf = pygame.Surface((FIELD_DRAW_WIDTH, FIELD_HEIGHT), pygame.SRCALPHA)
         pygame.draw.rect( self.field_surf, FIELD_COLOR,  self.field_surf.get_rect(), border_radius=20)
         self.bar_surf = pygame.Surface((COL_WIDTH*9.2, ROW_HEIGHT*1.3), pygame.SRCALPHA)
         pygame.draw.rect(self.bar_surf, BAR_COLOR, self.bar_surf.get_rect(), border_radius=45)
-        self._arrow_img = pygame.image.load("assets/sprites/arrow.png").convert_alpha()
+        self._arrow_img = self.assets.image(ARROW_PATH)
+        self.arrow_cache = RotationCache(self._arrow_img, ARROW_ANGLE_STEP, ARROW_CACHE_SIZE, ARROW_PRELOAD)
 
 
         self.bubble_surfaces = {
-            color: pygame.image.load(f"assets/sprites/bubble_{name}.png").convert_alpha()
+            color: self.assets.image(BUBBLE_SPRITE.format(name))
             for color, name in BUBBLE_COLOR_PAIRS
             }
         
         self.popup_assets = {
-            key: pygame.image.load(path).convert_alpha()
+            key: self.assets.image(path)
             for key, path in GAME_OVER_ASSETS
             }
         
         self.hud_assets = {
-            key: pygame.image.load(path).convert_alpha()
+            key: self.assets.image(path)
             for key, path in HUD_ASSETS
             }
 
-        self.fonts = {
-            "text": pygame.font.Font("assets/Arcade.ttf", 27),
-            "score": pygame.font.Font("assets/Arcade.ttf", 52),
-            "track": pygame.font.Font("assets/Arcade.ttf", 16),
-            "debug": pygame.font.Font(None, 24)
-        }
+        self.fonts = fonts if fonts is not None else load_fonts()
+        self.text_cache = TextCache(self.fonts)
+        self.profiler_panel = ProfilerPanel(self.fonts["debug"])
         self._init_popup_buttons()
         self._init_widget_buttons()
 
+        field_base = pygame.Surface((ceil(FIELD_DRAW_WIDTH), ceil(FIELD_HEIGHT))).convert()
+        field_base.blit(self.bg_img, (-GRID_LEFT_OFFSET, -GRID_TOP_OFFSET))
+        field_base.blit(self.field_surf, (0, 0))
+        self.grid_layer = GridLayer(self.bubble_surfaces, field_base, (GRID_LEFT_OFFSET, GRID_TOP_OFFSET))
+
+        # dirty-rect renderer state (see draw_ui_dirty)
+        self._backdrop: pygame.Surface | None = None
+        self._dirty_keys: set = set()
+
     def _init_popup_buttons(self):
         self.popup_img = self.popup_assets["popup"]
+        paths = dict(GAME_OVER_ASSETS)
         self.popup_buttons = {
-            "yes": Button(self.popup_assets["yes"], self.popup_assets["yes_hover"], POP_POS),
-            "quit": Button(self.popup_assets["quit"], self.popup_assets["quit_hover"], POP_POS),
-            "cross": Button(self.popup_assets["cross"], self.popup_assets["cross_hover"], POP_POS),
+            key: self._make_button(self.popup_assets, paths, key, POP_POS) for key in ("yes", "quit", "cross")
         }
 
     def _init_widget_buttons(self):
         self.widget_img = self.hud_assets["widget"]
         self.pause_small = self.hud_assets["pause_small"]
+        paths = dict(HUD_ASSETS)
         self.widget_buttons = {
-            "previous": Button(self.hud_assets["previous"], self.hud_assets["previous_hover"], WIDGET_POS),
-            "next": Button(self.hud_assets["next"], self.hud_assets["next_hover"], WIDGET_POS),
-            "playpause": Button(self.hud_assets["pause"], self.hud_assets["pause_hover"], WIDGET_POS),
-            "replay": Button(self.hud_assets["replay"], self.hud_assets["replay_hover"], WIDGET_POS),
-            "restart": Button(self.hud_assets["restart"], self.hud_assets["restart_hover"], RESTART_POS)
+            "previous": self._make_button(self.hud_assets, paths, "previous", WIDGET_POS),
+            "next": self._make_button(self.hud_assets, paths, "next", WIDGET_POS),
+            "playpause": self._make_button(self.hud_assets, paths, "pause", WIDGET_POS),
+            "replay": self._make_button(self.hud_assets, paths, "replay", WIDGET_POS),
+            "restart": self._make_button(self.hud_assets, paths, "restart", RESTART_POS)
         }
 
+    def _make_button(self, images, paths, key, pos):
+        """Button showing images[key] / images[key + "_hover"], hit-tested with key's cached mask."""
+        return Button(images[key], images[f"{key}_hover"], pos, self.assets.mask(paths[key]))
+
     def draw_bubble(self, bubble):
         """Blit a single bubble sprite at its current position."""
-        surf = self.bubble_surfaces[bubble.color]
-        self.screen.blit(surf, surf.get_rect(center=bubble.pos))
+        self._blit_item(self._bubble_item(bubble.color, bubble.pos))
 
-    def draw_bubble_grid(self, grid):
-        """Iterate through the grid and draw every occupied cell."""
-        for row in grid.bubbles:
-            for bubble in row:
-                if bubble:
-                    self.draw_bubble(bubble)
+    def draw_bubble_grid(self, grid, target=None):
+        """Bring the cached grid layer up to date and blit it (field included) in one go."""
+        self.grid_layer.sync(grid)
+        (target or self.screen).blit(self.grid_layer.surface, self.grid_layer.origin)
 
-    def draw_game_field(self):
-        self.screen.blit( self.field_surf, (GRID_LEFT_OFFSET, GRID_TOP_OFFSET))
+    def draw_game_field(self, target=None):
+        (target or self.screen).blit( self.field_surf, (GRID_LEFT_OFFSET, GRID_TOP_OFFSET))
 
     def draw_bubble_bar(self):
-        self.screen.blit(self.bar_surf, (GRID_LEFT_OFFSET-4, GRID_TOP_OFFSET + FIELD_HEIGHT + 1.9*ROW_HEIGHT))
+        self._blit_item(self._bar_item())
 
     def draw_warning_bubbles(self, warning_bubble, non_clearing_count, non_clearing_threshold):
         """Draw gray bubbles that indicate shots remaining before a new row."""
-        remaining_shots = max(0, non_clearing_threshold - non_clearing_count)
-        bubble_spacing = 40
-        x0, y = warning_bubble.pos
-        original_pos = warning_bubble.pos
-
-        for i in range(remaining_shots):
-            warning_bubble.pos = (x0 + i * bubble_spacing, y)
-            self.draw_bubble(warning_bubble)
-
-        warning_bubble.pos = original_pos
+        for item in self._warning_items(warning_bubble, non_clearing_count, non_clearing_threshold):
+            self._blit_item(item)
 
     def draw_score(self, score):
-            text_surf = self.fonts["text"].render(f"Score", True, (255, 255, 255))
-            score_surf = self.fonts["score"].render(f"{score}", True, (255, 255, 255))
-            track_surf = self.fonts["track"].render(f"{self.audio.track_name}", True, (255, 255, 255))
-            self.screen.blit(text_surf, (430, 720))
-            self.screen.blit(score_surf, (430, 687))
-            self.screen.blit(track_surf, (433, 672))
+        for item in self._score_items(score):
+            self._blit_item(item)
 
     def update_buttons(self, mouse_pos, mouse_lmb, game_over):
         """Update hover/click states for visible buttons."""
@@ -126,51 +134,354 @@ class GameUI:
             rep._idle, rep._hover = self.hud_assets["replay_off"],  self.hud_assets["replay_off_hover"]
         rep.update(mouse_pos, mouse_lmb)
 
-    def draw_ui(self, grid, bubble, next_bubble, warning_bubble, mouse_pos, game_over, DEBUG=False):
-        """Compose and draw the entire UI frame."""
-        self.screen.blit(self.bg_img, (0, 0))
-        self.screen.blit(self.widget_img, WIDGET_POS)
-        self.draw_game_field()
-        self.draw_bubble_grid(grid)
-        self.draw_warning_bubbles(warning_bubble, grid.non_clearing_count, grid.non_clearing_threshold)
-        self.draw_score(grid.score)
-
-        if bubble: self.draw_bubble(next_bubble)
-        self.draw_bubble_bar()
-        if bubble:
-            self.draw_aim_arrow(mouse_pos)
-            self.draw_bubble(bubble)
-
-        if self.audio.is_paused():
-            self.screen.blit(self.pause_small, WIDGET_POS)
-
-        for btn in self.widget_buttons.values():
-            btn.draw(self.screen)
-
-        if game_over:
-            self.screen.blit(self.popup_img, POP_POS)
-            for btn in self.popup_buttons.values():
-                btn.draw(self.screen)
-
-        if DEBUG:
-            coords = self.fonts["debug"].render(str(mouse_pos), True, (0, 0, 0))
-            self.screen.blit(coords, (0, 0))
+    def draw_ui(self, grid, bubble, next_bubble, warning_bubble, mouse_pos, game_over, DEBUG=False, profiler=None):
+        """Compose and draw the entire UI frame (with DEBUG, profiler's stats are overlaid)."""
+        self._draw_backdrop(self.screen, grid)
+        for item in self._overlay_items(grid, bubble, next_bubble, warning_bubble, mouse_pos, game_over, DEBUG, profiler):
+            self._blit_item(item)
+
+    def draw_ui_dirty(self, grid, bubble, next_bubble, warning_bubble, mouse_pos, game_over, DEBUG=False, profiler=None):
+        """Draw only what changed since the previous call; return the screen rects to update.
+
+        Static layers (background, widget, field, resting bubbles) live in a backdrop surface;
+        changed grid cells are patched into it, and moved or changed overlay items are
+        redrawn over the restored backdrop. Restart and row insertion rebuild everything.
+        """
+        items = self._overlay_items(grid, bubble, next_bubble, warning_bubble, mouse_pos, game_over, DEBUG, profiler)
+        keys = {(key, tuple(rect)) for key, _, rect in items}
+        prev_keys, self._dirty_keys = self._dirty_keys, keys
+        changed = self.grid_layer.sync(grid)
+
+        if self._backdrop is None or changed is None:
+            if self._backdrop is None:
+                self._backdrop = pygame.Surface(self.screen.get_size()).convert()
+            self._draw_backdrop(self._backdrop)
+            self.screen.blit(self._backdrop, (0, 0))
+            for item in items:
+                self._blit_item(item)
+            return [self.screen.get_rect()]
+
+        # grid cells that gained or lost a bubble (snap, pop)
+        dirty: list[pygame.Rect] = changed
+        for rect in changed:
+            self._backdrop.set_clip(rect)
+            self._draw_backdrop(self._backdrop)
+        self._backdrop.set_clip(None)
+
+        # overlay items that moved, appeared, disappeared or changed look
+        for _, rect in prev_keys ^ keys:
+            dirty.append(pygame.Rect(rect))
+
+        if not dirty:
+            return []
+        if len(dirty) > DIRTY_RECT_LIMIT:
+            dirty = [dirty[0].unionall(dirty[1:])]
+
+        for rect in dirty:
+            self.screen.blit(self._backdrop, rect, rect)
+            self.screen.set_clip(rect)
+            for item in items:
+                if item[2].colliderect(rect):
+                    self._blit_item(item)
+            self.screen.set_clip(None)
+        return dirty
 
     def draw_aim_arrow(self, mouse_pos) -> None:
         """Rotate the arrow sprite about its tail-pivot and blit at shooter."""
+        item = self._arrow_item(mouse_pos)
+        if item:
+            self._blit_item(item)
+
+    # display-list helpers -------------------------------
+    # each item is (key, surface, rect); key identifies what is drawn so the
+    # dirty-rect renderer can tell unchanged items apart from moved ones.
+    def _blit_item(self, item):
+        self.screen.blit(item[1], item[2])
+
+    def _bubble_item(self, color, pos):
+        surf = self.bubble_surfaces[color]
+        rect = surf.get_rect(center=pos)
+        return ("bubble", color), surf, rect
+
+    def _bar_item(self):
+        pos = (GRID_LEFT_OFFSET-4, GRID_TOP_OFFSET + FIELD_HEIGHT + 1.9*ROW_HEIGHT)
+        return ("bar",), self.bar_surf, self.bar_surf.get_rect(topleft=pos)
+
+    def _warning_items(self, warning_bubble, non_clearing_count, non_clearing_threshold):
+        remaining_shots = max(0, non_clearing_threshold - non_clearing_count)
+        bubble_spacing = 40
+        x0, y = warning_bubble.pos
+        return [self._bubble_item(warning_bubble.color, (x0 + i * bubble_spacing, y))
+                for i in range(remaining_shots)]
+
+    def _text_item(self, font, text, pos, color=WHITE):
+        surf = self.text_cache.render(font, text, color)
+        return ("text", font, text), surf, surf.get_rect(topleft=pos)
+
+    def _score_items(self, score):
+        score_surf = self.text_cache.number("score", score, WHITE)
+        return [self._text_item("text", "Score", (430, 720)),
+                (("text", "score", score), score_surf, score_surf.get_rect(topleft=(430, 687))),
+                self._text_item("track", f"{self.audio.track_name}", (433, 672))]
 
+    def _arrow_item(self, mouse_pos):
         cx, cy = SHOOTER_X, SHOOTER_Y
         dx, dy = mouse_pos[0] - cx, mouse_pos[1] - cy
         if dx == dy == 0:
-            return
+            return None
 
         # compute angle (deg), pygame’s +Y is down so invert dy
         angle = clamp_to_v(dx, -dy)
         
         # rotate around the image’s center (which is also its tail)
-        rotated = pygame.transform.rotozoom(self._arrow_img, angle, 1)
+        angle, rotated = self.arrow_cache.get(angle)
         rect    = rotated.get_rect(center=(cx, cy))
-        self.screen.blit(rotated, rect)
+        return ("arrow", angle), rotated, rect
+
+    def _button_item(self, btn):
+        surf = btn.image()
+        return ("button", id(surf)), surf, surf.get_rect(topleft=btn.pos)
+
+    def _overlay_items(self, grid, bubble, next_bubble, warning_bubble, mouse_pos, game_over, DEBUG, profiler=None):
+        """Everything drawn above the resting grid, in paint order."""
+        items = self._warning_items(warning_bubble, grid.non_clearing_count, grid.non_clearing_threshold)
+        items += self._score_items(grid.score)
+
+        if bubble: items.append(self._bubble_item(next_bubble.color, next_bubble.pos))
+        items.append(self._bar_item())
+        if bubble:
+            arrow = self._arrow_item(mouse_pos)
+            if arrow: items.append(arrow)
+            items.append(self._bubble_item(bubble.color, bubble.pos))
+
+        if self.audio.is_paused():
+            items.append((("pause_small",), self.pause_small, self.pause_small.get_rect(topleft=WIDGET_POS)))
+
+        items += [self._button_item(btn) for btn in self.widget_buttons.values()]
+
+        if game_over:
+            items.append((("popup",), self.popup_img, self.popup_img.get_rect(topleft=POP_POS)))
+            items += [self._button_item(btn) for btn in self.popup_buttons.values()]
+
+        if DEBUG:
+            items.append(self._text_item("debug", str(mouse_pos), (0, 0), BLACK))
+            if profiler is not None:
+                version, surf = self.profiler_panel.get(profiler)
+                items.append((("profiler", version), surf, surf.get_rect(topright=(SCREEN_WIDTH - 10, 70))))
+        return items
+
+    def _draw_backdrop(self, target, grid=None):
+        """Draw the static layers: background, widget, field and resting bubbles.
+
+        grid=None reuses the grid layer as last synced."""
+        target.blit(self.bg_img, (0, 0))
+        target.blit(self.widget_img, WIDGET_POS)
+        if grid is not None:
+            self.grid_layer.sync(grid)
+        target.blit(self.grid_layer.surface, self.grid_layer.origin)
+
+class GridLayer:
+    """Pre-composited opaque surface of the game field with every resting bubble on it.
+
+    Single-cell changes are patched in place; a new grid or an inserted row rebuilds it.
+    """
+    def __init__(self, bubble_surfaces, base: pygame.Surface, origin: tuple[int, int]):
+        """base: opaque field-area image (background + field tint) the bubbles sit on."""
+        self.bubble_surfaces = bubble_surfaces
+        self.base = base
+        self.origin = origin
+        self.surface = base.copy()
+        self._grid = None
+        self._revision = -1
+        self._rows_added = -1
+        self._codes: list[bytes] = []
+
+    def sync(self, grid) -> list[pygame.Rect] | None:
+        """Update the layer to match grid.
+
+        Returns the screen rects of patched cells ([] if nothing changed),
+        or None when the whole layer was rebuilt."""
+        if grid is self._grid and grid.revision == self._revision:
+            return []
+        codes = [bytes(row) for row in grid.codes]
+        rebuild = grid is not self._grid or grid.rows_added != self._rows_added
+        prev, self._codes = self._codes, codes
+        self._grid, self._revision, self._rows_added = grid, grid.revision, grid.rows_added
+
+        if rebuild:
+            self.surface.blit(self.base, (0, 0))
+            self._draw_rows(grid, range(grid.rows))
+            return None
+
+        changed = []
+        ox, oy = self.origin
+        for r, (old_row, new_row) in enumerate(zip(prev, codes)):
+            if old_row == new_row:
+                continue
+            for c in range(grid.cols):
+                if old_row[c] != new_row[c]:
+                    rect = self._cell_rect(grid, r, c)
+                    local = rect.move(-ox, -oy)
+                    self.surface.set_clip(local)
+                    self.surface.blit(self.base, (0, 0))
+                    self._draw_rows(grid, range(max(0, r - 1), min(grid.rows, r + 2)))
+                    self.surface.set_clip(None)
+                    changed.append(rect)
+        return changed
+
+    def _cell_rect(self, grid, row, col) -> pygame.Rect:
+        surf = next(iter(self.bubble_surfaces.values()))
+        return surf.get_rect(center=grid.get_position_for_cell(row, col))
+
+    def _draw_rows(self, grid, rows):
+        ox, oy = self.origin
+        for r in rows:
+            for c, code in enumerate(grid.codes[r]):
+                if code:
+                    surf = self.bubble_surfaces[CODE_COLORS[code]]
+                    x, y = grid.get_position_for_cell(r, c)
+                    self.surface.blit(surf, surf.get_rect(center=(x - ox, y - oy)))
+
+class ProfilerPanel:
+    """Profiler overlay: p50/p95/p99 per phase and a frame-time graph.
+
+    Re-rendered at most every PROFILE_REFRESH_MS; version changes with each render.
+    """
+    WIDTH = 300
+    GRAPH_H = 60
+    COLUMNS = (10, 120, 180, 240)       # x of the phase name and the three percentiles
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.surface: pygame.Surface | None = None
+        self.version = 0
+        self._stamp = 0
+
+    def get(self, profiler) -> tuple[int, pygame.Surface]:
+        now = perf_counter() * 1000
+        if self.surface is None or now - self._stamp >= PROFILE_REFRESH_MS:
+            self.surface = self._render(profiler)
+            self._stamp = now
+            self.version += 1
+        return self.version, self.surface
+
+    def _render(self, profiler) -> pygame.Surface:
+        stats = profiler.percentiles()
+        line_h = self.font.get_linesize()
+        table_h = line_h * (len(stats) + 1) + 8
+        surf = pygame.Surface((self.WIDTH, table_h + self.GRAPH_H + 8), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+
+        rows = [("ms", "p50", "p95", "p99")]
+        rows += [(name, *(f"{v:.2f}" for v in values)) for name, values in stats.items()]
+        for i, row in enumerate(rows):
+            for x, text in zip(self.COLUMNS, row):
+                surf.blit(self.font.render(text, True, WHITE), (x, 4 + i * line_h))
+
+        # one column per recent frame, scaled so the frame budget sits at mid-height
+        budget = 1 / FPS
+        base = table_h + self.GRAPH_H
+        pygame.draw.line(surf, GRAY, (0, base - self.GRAPH_H // 2), (self.WIDTH, base - self.GRAPH_H // 2))
+        for x, t in enumerate(profiler.frame_times()[-self.WIDTH:]):
+            h = min(self.GRAPH_H, int(t / (2 * budget) * self.GRAPH_H))
+            color = (90, 220, 120) if t <= budget * 1.05 else (255, 90, 90)
+            pygame.draw.line(surf, color, (x, base), (x, base - h))
+        return surf
+
+class TextCache:
+    """Rendered text surfaces keyed on (font, text, colour) with LRU eviction,
+    plus per-font digit glyphs so changing numbers are composed, not re-rasterised."""
+    def __init__(self, fonts: dict[str, pygame.font.Font], size=TEXT_CACHE_SIZE):
+        self.fonts = fonts
+        self.size = size
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self._digits: dict[tuple, dict[str, pygame.Surface]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        surf = self._surfaces.get(key)
+        if surf is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+        return surf
+
+    def _store(self, key, surf):
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.size:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def render(self, font: str, text: str, color=WHITE) -> pygame.Surface:
+        """Return text rendered (antialiased) in the named font, from cache when possible."""
+        key = (font, text, color)
+        surf = self._lookup(key)
+        if surf is None:
+            surf = self._store(key, self.fonts[font].render(text, True, color))
+        return surf
+
+    def number(self, font: str, value: int, color=WHITE) -> pygame.Surface:
+        """Return an integer composed from cached digit glyphs of the named font."""
+        text = str(value)
+        key = (font, text, color)
+        surf = self._lookup(key)
+        if surf is not None:
+            return surf
+
+        glyphs = self._digits.get((font, color))
+        if glyphs is None:
+            f = self.fonts[font]
+            glyphs = self._digits[(font, color)] = {ch: f.render(ch, True, color) for ch in "-0123456789"}
+
+        width = sum(glyphs[ch].get_width() for ch in text)
+        surf = pygame.Surface((width, self.fonts[font].get_height()), pygame.SRCALPHA)
+        x = 0
+        for ch in text:
+            # glyph boxes do not overlap; MAX copies each glyph's own alpha onto the clear surface
+            surf.blit(glyphs[ch], (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += glyphs[ch].get_width()
+        return self._store(key, surf)
+
+class RotationCache:
+    """Rotated copies of a sprite quantised to step degrees, kept in an LRU or fully preloaded."""
+    def __init__(self, image: pygame.Surface, step=ARROW_ANGLE_STEP, size=ARROW_CACHE_SIZE,
+                 preload=False, lo=MIN_ANGLE, hi=MAX_ANGLE):
+        self.image = image
+        self.step = step
+        self.size = size
+        self._frames: OrderedDict[int, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if preload:
+            first, last = round(lo / step), round(hi / step)
+            self.size = max(size, last - first + 1)
+            for i in range(first, last + 1):
+                self._frames[i] = self._render(i)
+
+    def _render(self, index: int) -> pygame.Surface:
+        return pygame.transform.rotozoom(self.image, index * self.step, 1)
+
+    def get(self, angle: float) -> tuple[float, pygame.Surface]:
+        """Return (quantised angle, rotated surface) for the nearest cached step."""
+        index = round(angle / self.step)
+        frame = self._frames.get(index)
+        if frame is None:
+            self.misses += 1
+            frame = self._frames[index] = self._render(index)
+            if len(self._frames) > self.size:
+                self._frames.popitem(last=False)
+        else:
+            self.hits += 1
+            self._frames.move_to_end(index)
+        return index * self.step, frame
+
+    def stats(self) -> dict:
+        """Frame count, pixel memory in bytes, quantisation step and hit/miss counters."""
+        nbytes = sum(f.get_bytesize() * f.get_width() * f.get_height() for f in self._frames.values())
+        return {"frames": len(self._frames), "bytes": nbytes, "step_deg": self.step,
+                "max_error_deg": self.step / 2, "hits": self.hits, "misses": self.misses}
 
 # Button class
 class Button:
@@ -180,13 +491,15 @@ class Button:
 
     def __init__(self, idle: pygame.Surface,
                        hover: pygame.Surface,
-                       pos: tuple[int, int]):
+                       pos: tuple[int, int],
+                       mask=None):
+        """mask: precomputed hit mask of idle (anything with get_at); built from idle if None."""
         self._idle  = idle.convert_alpha()
         self._hover = hover.convert_alpha()
         self.pos    = pygame.Vector2(pos)
 
         self.rect   = self._idle.get_rect(topleft=pos)
-        self.mask   = pygame.mask.from_surface(self._idle)
+        self.mask   = mask if mask is not None else pygame.mask.from_surface(self._idle)
 
         self._hovered: bool = False
         self._clicked: bool = False
@@ -203,9 +516,13 @@ class Button:
         self._clicked = now_pressed and not self._prev_pressed
         self._prev_pressed = now_pressed
 
+    def image(self) -> pygame.Surface:
+        """Return the hover or idle image, whichever is currently shown."""
+        return self._hover if self._hovered else self._idle
+
     def draw(self, target: pygame.Surface) -> None:
         """Blit the button’s hover or idle image onto the target surface."""
-        target.blit(self._hover if self._hovered else self._idle, self.pos)
+        target.blit(self.image(), self.pos)
 
     def is_hovered(self) -> bool: return self._hovered
     def is_clicked(self) -> bool: return self._clicked
@@ -0,0 +1,73 @@
+# loading.py
+import threading
+from time import perf_counter
+import pygame
+from config import *
+from assets import read_assets
+from audio import AudioManager
+from game_view import load_fonts
+
+LOADING_BG = (118, 186, 232)
+LOADING_BAR = (230, 246, 255)
+
+class Loader:
+    """Startup work that needs no display surface, run on a daemon thread:
+    asset cache files, fonts, then audio (mixer, first track, sound effects)."""
+    def __init__(self):
+        self.prefetched = None              # read_assets() output, for load_assets(prefetched=...)
+        self.fonts: dict | None = None
+        self.audio: AudioManager | None = None
+        self.times: dict[str, float] = {}   # seconds per stage
+        self.error: BaseException | None = None
+        self._stages = [("assets", self._read_assets), ("fonts", self._load_fonts), ("audio", self._load_audio)]
+        self._finished = 0
+        self._thread = threading.Thread(target=self._run, name="loader", daemon=True)
+
+    def start(self) -> "Loader":
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for name, stage in self._stages:
+                t0 = perf_counter()
+                stage()
+                self.times[name] = perf_counter() - t0
+                self._finished += 1
+        except BaseException as e:          # re-raised on the main thread by wait()
+            self.error = e
+
+    def _read_assets(self):
+        self.prefetched = read_assets()
+
+    def _load_fonts(self):
+        self.fonts = load_fonts()
+
+    def _load_audio(self):
+        self.audio = AudioManager()
+
+    @property
+    def progress(self) -> float:
+        return self._finished / len(self._stages)
+
+    def wait(self, timeout=None) -> bool:
+        """Block until loading finishes or timeout passes; return True once finished.
+
+        A loader failure is re-raised here."""
+        self._thread.join(timeout)
+        if self.error is not None:
+            raise self.error
+        return not self._thread.is_alive()
+
+def draw_loading(screen: pygame.Surface, font: pygame.font.Font, progress: float):
+    """Minimal loading frame: flat sky colour, caption and progress bar."""
+    screen.fill(LOADING_BG)
+    text = font.render("Loading...", True, WHITE)
+    screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30)))
+    bar = pygame.Rect(0, 0, 300, 14)
+    bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10)
+    pygame.draw.rect(screen, LOADING_BAR, bar, 2, border_radius=7)
+    fill = bar.inflate(-6, -6)
+    fill.width = int(fill.width * progress)
+    if fill.width:
+        pygame.draw.rect(screen, LOADING_BAR, fill, border_radius=4)
@@ -1,103 +1,244 @@
 # main.py
+import os
+import struct
+import sys
+import time
+from time import perf_counter
 import pygame
-import random
 from config import *
-from game_logic import Bubble, BubbleGrid, compute_velocity
+from math import atan2, degrees, cos, sin, radians
+from game_logic import Bubble, ManualClock
+from simulation import Simulation
 from game_view import GameUI
-from audio import AudioManager
+from assets import load_assets
+from loading import Loader, draw_loading
+from replay import Replay
+from autoplay import AutoPlayer
+from profiler import FrameProfiler
+
+# frame phases timed by the profiler (F3 shows the overlay)
+PHASES = ["events", "input", "update", "draw", "present", "wait"]
+EVENTS, INPUT, UPDATE, DRAW, PRESENT, WAIT = range(len(PHASES))
 
 class Game:
-    def __init__(self):
-        """Initialize Pygame, audio, UI layer, and first game state."""
-        pygame.init()
+    def __init__(self, replay: Replay | None = None, autoplay: bool = False):
+        """Initialize Pygame, audio, UI layer, and first game state.
+
+        A loading frame goes up first; cache files, fonts and audio then load on a
+        background thread while the board is built here.
+        With replay, the recorded shots are fired at their recorded pace instead of mouse input;
+        with autoplay, an AutoPlayer picks every shot and restarts finished games.
+        """
+        started = perf_counter()
+        # only the subsystems in use: display (with events) and font; AudioManager opens the mixer
+        pygame.display.init()
+        pygame.font.init()
         self.clock = pygame.time.Clock()
         icon = pygame.image.load("assets/sprites/bubble_icon.png")
         pygame.display.set_icon(icon)
         pygame.display.set_caption("Aero Bubble Shooter")
 
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.audio = AudioManager()
-        self.ui = GameUI(self.screen, self.audio)
+        loading_font = pygame.font.Font(None, 40)
+        draw_loading(self.screen, loading_font, 0.0)
+        pygame.display.flip()
+        self.startup = {"first frame": perf_counter() - started}   # milestones, s since Game() began
+        self._started = started
+        loader = Loader().start()
+
+        self.audio = None                   # set once the loader finishes
+        self.sim_clock = ManualClock()      # simulation time: advances one SIM_TICK per tick
+        self.sim = Simulation(events=self.on_event, clock=self.sim_clock, start=False)
+        self.accumulator = 0.0              # real seconds not yet simulated
         self.running = True
-        self.restart_game()
-
-    def restart_game(self):
-        """Reset full game state: grid, shooter, preview, counters."""
-        self.grid = BubbleGrid(audio=self.audio)
-        self.grid.populate_random_rows()
-        self.bubble = Bubble(color=random.choice(BUBBLE_COLORS), pos=(SHOOTER_X, SHOOTER_Y))
-        self.next_bubble = Bubble(color=random.choice(BUBBLE_COLORS), pos=(PREVIEW_X, PREVIEW_Y))
+        self.profiler = FrameProfiler(PHASES)
+        self.show_profiler = False
+        self.idle_since: int | None = None  # tick when the game last became idle
+        self.woke_by = None                 # event that ended an idle wait, handled next frame
+        self.paced = False                  # last frame ended in an idle wait or at IDLE_FPS
+        self.playback = replay
+        self.bot = AutoPlayer() if autoplay and not replay else None
+        self.restart_game(resume=not (self.playback or self.bot))
+
+        while not loader.wait(1 / 30):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+            draw_loading(self.screen, loading_font, loader.progress)
+            pygame.display.flip()
+        self.audio = loader.audio
+        self.ui = GameUI(self.screen, self.audio, load_assets(prefetched=loader.prefetched), loader.fonts)
+        self.startup["loaded"] = perf_counter() - started
+        self.load_times = loader.times
+
+    def on_event(self, name):
+        """Simulation event sink: forward to audio once it has loaded."""
+        if self.audio is not None:
+            self.audio.on_event(name)
+
+    def report_startup(self):
+        """Record time to interactive (first game frame presented) and print the startup timeline."""
+        self.startup["interactive"] = perf_counter() - self._started
+        if REPORT_STARTUP:
+            stages = ", ".join(f"{name} {t * 1000:.0f}" for name, t in self.load_times.items())
+            print(f"startup: first frame {self.startup['first frame'] * 1000:.0f} ms, "
+                  f"loaded {self.startup['loaded'] * 1000:.0f} ms ({stages} ms on the loader thread), "
+                  f"interactive {self.startup['interactive'] * 1000:.0f} ms")
+
+    def restart_game(self, resume=False):
+        """Reset full game state: grid, shooter, preview, counters.
+
+        With resume, the game saved on the last exit is continued instead of a new one.
+        """
+        if self.sim.grid is not None:       # no game yet on the first call
+            self.save_replay()
+        if not (resume and self.resume_game()):
+            self.sim.reset(self.playback.seed if self.playback else None)
         self.warning_bubble = Bubble(color=GRAY, pos=(PREVIEW_X + 40, PREVIEW_Y))
-        self.bubble_ready = True
-        self.game_over = False
+        self.playback_shot = 0
+        if self.playback and self.playback.shots:
+            self.playback_due = self.sim_clock() + self.playback.shots[0][0]
+        self.game_over_at = None            # sim time the current game ended (autoplay restarts)
+        self.checkpoint: tuple[int, bytes] | None = None    # (shots, snapshot) when last ready to shoot
+
+    def resume_game(self) -> bool:
+        """Continue the game saved at SAVE_PATH on the last exit; False if there is none
+        or it cannot be loaded."""
+        if not SAVE_PATH or not os.path.exists(SAVE_PATH):
+            return False
+        try:
+            with open(SAVE_PATH, "rb") as f:
+                self.sim.restore(f.read())
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print("Saved game not loaded:", e)
+            return False
+        return True
+
+    def save_game(self):
+        """On exit: store the game as of its last ready shooter at SAVE_PATH, or remove
+        the save once the game is over (autoplay and replays never save)."""
+        if not SAVE_PATH or self.playback or self.bot:
+            return
+        try:
+            if self.sim.game_over:
+                if os.path.exists(SAVE_PATH):
+                    os.remove(SAVE_PATH)
+            elif self.checkpoint is not None:
+                with open(SAVE_PATH, "wb") as f:
+                    f.write(self.checkpoint[1])
+        except OSError as e:
+            print("Game not saved:", e)
+
+    def save_replay(self):
+        """Write the current game to REPLAY_DIR when recording is on and a shot was fired."""
+        if not RECORD_REPLAYS or self.playback or self.sim.restored or not self.sim.shot_log:
+            return
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.sim.seed:016x}.replay"
+        Replay.from_simulation(self.sim).save(os.path.join(REPLAY_DIR, name))
+
+    def playback_angle(self, now) -> float | None:
+        """Angle of the next recorded shot once it is due and the shooter is ready, else None."""
+        shots = self.playback.shots
+        if self.playback_shot >= len(shots) or now < self.playback_due or not self.sim.can_shoot():
+            return None
+        angle = shots[self.playback_shot][1]
+        self.playback_shot += 1
+        if self.playback_shot < len(shots):
+            self.playback_due = now + shots[self.playback_shot][0]
+        return angle
+
+    def playback_aim(self) -> tuple[float, float]:
+        """A point along the next recorded shot, standing in for the mouse when aiming the arrow."""
+        shots = self.playback.shots
+        a = radians(shots[min(self.playback_shot, len(shots) - 1)][1]) if shots else radians(90)
+        return (SHOOTER_X + 100 * cos(a), SHOOTER_Y - 100 * sin(a))
 
     def should_shoot(self, mouse_pos, click_frame):
         """Return True when a left-click is valid for firing the bubble."""
-        return (click_frame and self.bubble_ready and self.bubble is not None and self.bubble.velocity.length_squared() == 0 and
+        return (click_frame and self.sim.can_shoot() and
                 GRID_LEFT_OFFSET <= mouse_pos[0] <= GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH and
-                GRID_TOP_OFFSET  <= mouse_pos[1] <= GRID_TOP_OFFSET  + FIELD_HEIGHT and not self.grid.pop_queue)
+                GRID_TOP_OFFSET  <= mouse_pos[1] <= GRID_TOP_OFFSET  + FIELD_HEIGHT)
+
+    def is_idle(self, events) -> bool:
+        """True when no input arrived and nothing on screen would change without some."""
+        if events or self.show_profiler:
+            return False
+        if self.playback and self.playback_shot < len(self.playback.shots):
+            return False
+        if self.bot:
+            return False
+        return self.sim.is_idle()
+
+    def pace(self, events):
+        """End the frame: tick at FPS, or once idle for IDLE_AFTER_MS, at IDLE_FPS or
+        blocked until input (music end events count) or IDLE_WAIT_MS pass."""
+        now = perf_counter() * 1000
+        if not (IDLE_PACING and self.is_idle(events)):
+            self.idle_since = None
+        elif self.idle_since is None:
+            self.idle_since = now
+
+        self.paced = not (self.idle_since is None or now - self.idle_since < IDLE_AFTER_MS)
+        if not self.paced:
+            self.clock.tick(FPS)
+        elif IDLE_FPS:
+            self.clock.tick(IDLE_FPS)
+        else:
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            self.woke_by = event if event.type != pygame.NOEVENT else None
+            self.clock.tick()
 
     def run(self):
         """Execute the event loop, update logic, and delegate all rendering."""
+        profiler = self.profiler
+        profiler.begin_frame()
         while self.running:
             click_frame = False
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            if self.woke_by is not None:
+                events.insert(0, self.woke_by)
+                self.woke_by = None
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.show_profiler = not self.show_profiler
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     click_frame = True
                 elif event.type == self.audio.NEXT_EVENT:
-                    if self.audio.loop:
-                        self.audio.replay()
-                    else: 
-                        self.audio.next()
+                    self.audio.on_music_end()
+
+            profiler.mark(EVENTS)
 
             # 2. INPUT SNAPSHOT _________________________________________
             mouse_pos = pygame.mouse.get_pos()
             mouse_lmb = pygame.mouse.get_pressed()[0]
-            self.ui.update_buttons(mouse_pos, mouse_lmb, self.game_over)
-            if not self.game_over:
+            self.ui.update_buttons(mouse_pos, mouse_lmb, self.sim.game_over)
+            profiler.mark(INPUT)
+            if not self.sim.game_over:
                 # Shoot bubble
-                if self.should_shoot(mouse_pos, click_frame):
-                    assert self.bubble is not None
-                    self.bubble.velocity = compute_velocity(self.bubble.pos, mouse_pos, PROJECTILE_SPEED)
-                    self.bubble_ready = False
-
-                # Move active bubble
-                if self.bubble is not None:
-                    self.bubble.move(self.clock.get_time() / 1000, self.grid)
-
-                    # snap to cell when it stops and add it to grid
-                    if self.bubble.velocity.length_squared() == 0 and not self.bubble_ready:
-                        hit_r, hit_c = getattr(self.bubble, "hit_cell", (None, None))
-                        placed_cell = self.grid.snap_bubble_to_grid(self.bubble, hit_r, hit_c)
-                        if placed_cell is None:
-                            self.game_over = True
-                        else:
-                            # match-3 detection → enqueue pops (floaters handled inside grid)
-                            match_chain = self.grid.get_connected_same_color(*placed_cell)
-                            self.game_over = not self.grid.destroy_bubbles(match_chain)
-
-                        if hasattr(self.bubble, "hit_cell"):
-                            delattr(self.bubble, "hit_cell")
-
-                        self.bubble = None
-                        self.bubble_ready = False
-
-                # Update grid state
-                self.grid.update(pygame.time.get_ticks())
-
-                # spawn a new shooter when ready
-                if self.bubble is None and not self.bubble_ready:
-                    self.bubble = self.next_bubble
-                    self.bubble.pos = pygame.Vector2(SHOOTER_X, SHOOTER_Y)
-                    self.next_bubble = Bubble(color=random.choice(BUBBLE_COLORS),
-                                        pos=(PREVIEW_X, PREVIEW_Y))
-                    self.bubble_ready = True
-            
+                if self.playback:
+                    angle = self.playback_angle(self.sim_clock())
+                    if angle is not None:
+                        self.sim.fire(angle)
+                elif self.bot:
+                    angle = self.bot.poll(self.sim)
+                    if angle is not None:
+                        self.sim.fire(angle)
+                elif self.should_shoot(mouse_pos, click_frame):
+                    # pygame’s +Y is down so invert dy
+                    angle = degrees(atan2(SHOOTER_Y - mouse_pos[1], mouse_pos[0] - SHOOTER_X))
+                    self.sim.fire(angle)
+
             else:
+                if self.bot:
+                    if self.game_over_at is None:
+                        self.game_over_at = self.sim_clock()
+                    elif self.sim_clock() - self.game_over_at >= AUTOPLAY_RESTART_MS:
+                        self.restart_game()
                 # React to clicks
                 if self.ui.popup_buttons["yes"].is_clicked():
                     self.audio.play_click()
@@ -126,13 +267,56 @@ class Game:
                 self.audio.play_click()
                 self.restart_game()
 
-            # _________ drawing _________
-            self.ui.draw_ui(self.grid, self.bubble, self.next_bubble, self.warning_bubble, mouse_pos, self.game_over)
+            # Move active bubble, land it, pop matches and reload the shooter, in fixed
+            # ticks; the leftover fraction of a tick blends the drawn projectile position.
+            # Time spent idling is dropped, not simulated: nothing moved during it, and a
+            # shot fired on the frame that ends it must not start with a burst of ticks
+            if self.paced:
+                self.accumulator = 0.0
+            else:
+                self.accumulator = min(self.accumulator + self.clock.get_time() / 1000,
+                                       MAX_FRAME_TICKS * SIM_TICK)
+            while self.accumulator >= SIM_TICK:
+                self.sim.update(SIM_TICK, self.sim_clock.advance(1000 / SIM_HZ))
+                self.accumulator -= SIM_TICK
+            bubble = self.sim.render_bubble(self.accumulator / SIM_TICK)
+            if (not self.sim.game_over and self.sim.is_idle()
+                    and (self.checkpoint is None or self.checkpoint[0] != self.sim.shots)):
+                self.checkpoint = (self.sim.shots, self.sim.snapshot())
+            self.audio.flush_effects()      # this frame's pops/plops/clicks, coalesced
+            self.audio.update_music()       # queue the following track once prefetched
+            profiler.mark(UPDATE)
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            # _________ drawing _________
+            if self.playback and not self.sim.game_over:
+                mouse_pos = self.playback_aim()
+            elif self.bot and not self.sim.game_over:
+                mouse_pos = self.bot.aim_point()
+            overlay = self.profiler if self.show_profiler else None
+            if DIRTY_RECTS:
+                rects = self.ui.draw_ui_dirty(self.sim.grid, bubble, self.sim.next_bubble, self.warning_bubble, mouse_pos, self.sim.game_over,
+                                              DEBUG=self.show_profiler, profiler=overlay)
+                profiler.mark(DRAW)
+                pygame.display.update(rects)
+            else:
+                self.ui.draw_ui(self.sim.grid, bubble, self.sim.next_bubble, self.warning_bubble, mouse_pos, self.sim.game_over,
+                                DEBUG=self.show_profiler, profiler=overlay)
+                profiler.mark(DRAW)
+                pygame.display.flip()
+            profiler.mark(PRESENT)
+            if "interactive" not in self.startup:
+                self.report_startup()
+            self.pace(events)
+            profiler.mark(WAIT)
+            profiler.end_frame()
+        self.save_replay()
+        self.save_game()
+        if self.bot:
+            self.bot.close()
+        if PROFILE_CSV:
+            profiler.to_csv(PROFILE_CSV)
         pygame.quit()
 
 
 if __name__ == "__main__":
-    Game().run()
+    Game(autoplay="--autoplay" in sys.argv[1:]).run()
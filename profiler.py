@@ -0,0 +1,64 @@
+# profiler.py
+from array import array
+from time import perf_counter
+from config import *
+
+class FrameProfiler:
+    """Per-phase frame timings in a fixed-size ring buffer.
+
+    Call begin_frame() at the top of the loop, mark(i) after phase i and end_frame()
+    last; each call is one perf_counter read and one array store.
+    """
+    def __init__(self, phases, size=PROFILE_FRAMES):
+        self.phases = list(phases)
+        self.size = size
+        self.samples = [array("d", bytes(8 * size)) for _ in self.phases]   # seconds, per phase
+        self.index = 0          # slot the current frame writes to
+        self.count = 0          # filled slots (<= size)
+        self.frames = 0         # frames recorded since creation
+        self._last = perf_counter()
+
+    def begin_frame(self):
+        self._last = perf_counter()
+
+    def mark(self, phase: int):
+        """Record the time since the previous mark (or begin_frame) against phase."""
+        now = perf_counter()
+        self.samples[phase][self.index] = now - self._last
+        self._last = now
+
+    def end_frame(self):
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.frames += 1
+
+    def _ordered(self, values) -> list[float]:
+        """Ring contents oldest first."""
+        if self.count < self.size:
+            return list(values[:self.count])
+        return list(values[self.index:]) + list(values[:self.index])
+
+    def frame_times(self) -> list[float]:
+        """Whole-frame durations (sum of phases), oldest first."""
+        return [sum(frame) for frame in zip(*(self._ordered(s) for s in self.samples))]
+
+    def percentiles(self, qs=(50, 95, 99)) -> dict[str, list[float]]:
+        """Nearest-rank percentiles in ms per phase, plus "frame" for whole frames."""
+        series = {name: self._ordered(s) for name, s in zip(self.phases, self.samples)}
+        series["frame"] = self.frame_times()
+        out = {}
+        for name, values in series.items():
+            values.sort()
+            n = len(values)
+            out[name] = [values[min(n - 1, n * q // 100)] * 1000 if n else 0.0 for q in qs]
+        return out
+
+    def to_csv(self, path):
+        """Write the buffered frames, oldest first: one row per frame, ms per phase."""
+        columns = [self._ordered(s) for s in self.samples]
+        first = self.frames - self.count
+        with open(path, "w") as f:
+            f.write(",".join(["frame", *self.phases, "total"]) + "\n")
+            for i, row in enumerate(zip(*columns)):
+                cells = [f"{v * 1000:.4f}" for v in row]
+                f.write(f"{first + i}," + ",".join(cells) + f",{sum(row) * 1000:.4f}\n")
@@ -0,0 +1,83 @@
+# replay.py
+"""Compact binary replays: the game seed plus the angle and timing of every shot.
+
+Usage: python replay.py FILE [--render]
+Headless playback resolves shots as fast as the CPU allows; --render plays the
+replay in the game window at the recorded pace.
+"""
+import struct
+import sys
+from time import perf_counter
+
+from simulation import Simulation
+
+MAGIC = b"BSRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQI")    # magic, version, seed, shot count
+SHOT = struct.Struct("<Id")         # ms since the previous shot, angle in degrees
+
+class Replay:
+    """One game: seed plus (delay_ms, angle) per shot, as recorded by Simulation.fire."""
+    def __init__(self, seed: int, shots=()):
+        self.seed = seed
+        self.shots: list[tuple[int, float]] = list(shots)
+
+    def __len__(self) -> int:
+        return len(self.shots)
+
+    @classmethod
+    def from_simulation(cls, sim: Simulation) -> "Replay":
+        """Snapshot the seed and shots of sim's current game."""
+        return cls(sim.seed, sim.shot_log)
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, len(self.shots)))
+        for delay, angle in self.shots:
+            out += SHOT.pack(delay, angle)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        magic, version, seed, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a version {VERSION} replay")
+        if len(data) != HEADER.size + count * SHOT.size:
+            raise ValueError(f"replay truncated: expected {count} shots")
+        return cls(seed, SHOT.iter_unpack(data[HEADER.size:]))
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+def play(replay: Replay, events=None) -> Simulation:
+    """Re-run replay headlessly (no timing, no rendering) and return the finished simulation."""
+    sim = Simulation(events=events, seed=replay.seed)
+    for _, angle in replay.shots:
+        if not sim.step(angle):
+            break
+    return sim
+
+def main(argv):
+    if not argv or argv[0].startswith("-"):
+        print(__doc__.strip().splitlines()[2])
+        return 2
+    replay = Replay.load(argv[0])
+    if "--render" in argv[1:]:
+        from main import Game
+        Game(replay=replay).run()
+        return 0
+
+    t0 = perf_counter()
+    sim = play(replay)
+    elapsed = perf_counter() - t0
+    print(f"seed {replay.seed:#x}: {sim.shots}/{len(replay)} shots, score {sim.grid.score}, "
+          f"game over {sim.game_over}  ({sim.shots / elapsed:,.0f} shots/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,172 @@
+# simulation.py
+from math import cos, sin, radians
+import random as rand
+import struct
+from config import *
+from game_logic import Bubble, BubbleGrid, GameRandom, ManualClock
+from trajectory import ShotPath, land_shot, solve_shot
+
+SNAPSHOT_MAGIC = b"BSSN"
+SNAPSHOT_VERSION = 1
+# magic, version, seed, RNG draws, shots, shooter and preview colour codes, game over;
+# followed by BubbleGrid.snapshot()
+SNAPSHOT = struct.Struct("<4sBQIIBBB")
+
+class Simulation:
+    """Pygame-free game state: grid, shooter, preview bubble and game-over flag."""
+    def __init__(self, events=None, clock=None, seed=None, start=True):
+        """Store event sink and clock (shared with every grid) and start a fresh game.
+
+        With start=False there is no game (grid is None) until reset() or restore().
+        """
+        self.events = events
+        self.clock = clock if clock is not None else ManualClock()
+        self.grid: BubbleGrid | None = None
+        if start:
+            self.reset(seed)
+
+    def reset(self, seed=None):
+        """Build a new random board, shooter and preview bubble.
+
+        Every colour of the game comes from one RNG seeded with seed (default: a fresh
+        seed from the global random module), so seed plus shot angles replay the game.
+        """
+        if self.grid is not None:
+            self.grid.pops.clear()          # cancel pops still pending on the old board
+        self.seed = seed if seed is not None else rand.getrandbits(64)
+        self.rng = GameRandom(self.seed)
+        self.grid = BubbleGrid(events=self.events, clock=self.clock, rng=self.rng)
+        self.grid.populate_random_rows()
+        self._start(self.rng.choice(BUBBLE_COLORS), self.rng.choice(BUBBLE_COLORS))
+
+    def _start(self, color, next_color, shots=0, game_over=False):
+        """Load the shooter (none if color is None: a finished game) and preview and clear
+        per-shot state (after reset or restore)."""
+        self.shot_log: list[tuple[int, float]] = []   # (ms since previous shot, angle) per shot
+        self._last_shot = self.clock()
+        self.restored = False                 # True: the game did not start at seed (no replay)
+        self.bubble: Bubble | None = Bubble(color=color, pos=(SHOOTER_X, SHOOTER_Y)) if color else None
+        self.next_bubble = Bubble(color=next_color, pos=(PREVIEW_X, PREVIEW_Y))
+        self.bubble_ready = self.bubble is not None
+        self.game_over = game_over
+        self.shots = shots
+        self.path: ShotPath | None = None     # precomputed flight of the active shot
+        self.flight = 0.0                     # pixels travelled along self.path
+        self.prev_pos = (SHOOTER_X, SHOOTER_Y)  # projectile position before the last update
+
+    def snapshot(self) -> bytes:
+        """The whole game as about 300 bytes: seed and RNG position, counters, shooter
+        and preview colours, then the grid. Only a settled game can be stored."""
+        if not self.is_idle():
+            raise ValueError("snapshot needs a settled game: no shot in flight, no pops pending")
+        header = SNAPSHOT.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.seed, self.rng.draws, self.shots,
+                               COLOR_CODES[self.bubble.color] if self.bubble else 0,
+                               COLOR_CODES[self.next_bubble.color],
+                               self.game_over)
+        return header + self.grid.snapshot()
+
+    def restore(self, data):
+        """Continue the game stored by snapshot() (this game is discarded)."""
+        magic, version, seed, draws, shots, color, next_color, game_over = SNAPSHOT.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"not a version {SNAPSHOT_VERSION} game snapshot")
+        if self.grid is not None:
+            self.grid.pops.clear()
+        self.seed = seed
+        self.rng = GameRandom(seed)
+        self.rng.skip(draws)
+        self.grid = BubbleGrid.from_snapshot(memoryview(data)[SNAPSHOT.size:], self.events, self.clock, self.rng)
+        self._start(CODE_COLORS.get(color), CODE_COLORS[next_color], shots, bool(game_over))
+        self.restored = True
+
+    def is_idle(self) -> bool:
+        """True when nothing moves or pops until the next shot (or restart)."""
+        return self.path is None and self.grid.is_settled() and (self.game_over or self.bubble_ready)
+
+    def can_shoot(self) -> bool:
+        """Return True when the shooter is loaded and no pops are pending."""
+        return (not self.game_over and self.bubble_ready and self.bubble is not None
+                and not self.bubble.is_moving() and not self.grid.pops)
+
+    def fire(self, angle):
+        """Launch the shooter at angle degrees (counter-clockwise from +x, screen y up).
+
+        The whole flight is solved here; update() only animates along the path.
+        """
+        assert self.bubble is not None
+        angle = max(MIN_ANGLE, min(MAX_ANGLE, angle))
+        now = self.clock()
+        self.shot_log.append((int(now - self._last_shot), angle))
+        self._last_shot = now
+        self.path = solve_shot(self.grid, self.bubble.pos, angle, self.bubble.radius)
+        self.flight = 0.0
+        self.prev_pos = self.bubble.pos
+        a = radians(angle)
+        self.bubble.velocity = (cos(a) * PROJECTILE_SPEED, -sin(a) * PROJECTILE_SPEED)
+        self.bubble_ready = False
+        self.shots += 1
+
+    def update(self, delta_time, now):
+        """Advance one frame: move projectile, land it, process pops, reload shooter."""
+        if self.game_over:
+            return
+
+        if self.bubble is not None and self.path is not None:
+            self.prev_pos = self.bubble.pos
+            self.flight += PROJECTILE_SPEED * delta_time
+            self.bubble.pos = self.path.point_at(self.flight)
+            if self.flight >= self.path.length:
+                self._land()
+
+        self.grid.update(now)
+
+        if self.bubble is None and not self.bubble_ready and not self.game_over:
+            self._reload()
+
+    def render_bubble(self, alpha) -> Bubble | None:
+        """The shooter bubble as it should be drawn alpha (0..1) of a tick past the last update.
+
+        In flight this is a stand-in at the blend of the last two positions;
+        otherwise the bubble itself.
+        """
+        if self.bubble is None or self.path is None:
+            return self.bubble
+        (x0, y0), (x1, y1) = self.prev_pos, self.bubble.pos
+        return Bubble(self.bubble.color, (x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha))
+
+    def step(self, shot_angle) -> bool:
+        """Resolve a whole shot (flight, snap, match, pops, floaters, rows) without rendering.
+
+        Returns False once the game is over.
+        """
+        if not self.can_shoot():
+            return not self.game_over
+        self.fire(shot_angle)
+        self._land()
+        self.grid.flush_pops()
+
+        if not self.game_over:
+            self._reload()
+        return not self.game_over
+
+    def _land(self):
+        """Snap the projectile at its contact point to the grid and score its colour match."""
+        assert self.bubble is not None and self.path is not None
+        placed_cell = land_shot(self.grid, self.path, self.bubble)
+        if placed_cell is None:
+            self.game_over = True
+        else:
+            # match-3 detection → enqueue pops (floaters handled inside grid)
+            match_chain = self.grid.get_connected_same_color(*placed_cell)
+            self.game_over = not self.grid.destroy_bubbles(match_chain)
+
+        self.path = None
+        self.bubble = None
+        self.bubble_ready = False
+
+    def _reload(self):
+        """Move the preview bubble into the shooter and draw a new preview."""
+        self.bubble = self.next_bubble
+        self.bubble.pos = (SHOOTER_X, SHOOTER_Y)
+        self.next_bubble = Bubble(color=self.rng.choice(BUBBLE_COLORS), pos=(PREVIEW_X, PREVIEW_Y))
+        self.bubble_ready = True
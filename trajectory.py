@@ -0,0 +1,132 @@
+# trajectory.py
+from math import cos, sin, sqrt, radians, hypot
+from config import *
+
+class ShotPath:
+    """Precomputed projectile path: straight segments between wall bounces, ending at contact."""
+    def __init__(self, points: list[tuple[float, float]], hit_cell: tuple[int, int] | None):
+        """Store path vertices and the occupied cell struck (None when the ceiling stops it)."""
+        self.points = points
+        self.hit_cell = hit_cell
+        self.contact = points[-1]
+        self._ends: list[float] = []        # cumulative length at the end of each segment
+        total = 0.0
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            total += hypot(x1 - x0, y1 - y0)
+            self._ends.append(total)
+        self.length = total
+
+    def point_at(self, distance: float) -> tuple[float, float]:
+        """Return the position after travelling distance pixels along the path."""
+        if distance >= self.length:
+            return self.contact
+        start = 0.0
+        for i, end in enumerate(self._ends):
+            if distance <= end:
+                (x0, y0), (x1, y1) = self.points[i], self.points[i + 1]
+                f = (distance - start) / (end - start) if end > start else 1.0
+                return (x0 + (x1 - x0) * f, y0 + (y1 - y0) * f)
+            start = end
+        return self.contact
+
+def _first_hit(grid, x0, y0, dx, dy, t_max, reach):
+    """Sweep a circle along one upward (dy < 0) segment; return (t, cell) of the first
+    occupied cell touched. Ties go to the cell latest in row-major order."""
+    best_t, best_cell = t_max, None
+    reach_sq = reach * reach
+
+    # rows from the bottom up: each row's earliest possible contact comes later than the
+    # one below, so the sweep stops at the first row that cannot beat the best hit
+    y1 = y0 + dy * t_max
+    lo = max(0, int((y1 - reach - GRID_TOP_OFFSET) // ROW_HEIGHT))
+    hi = min(grid.rows - 1, int((y0 + reach - GRID_TOP_OFFSET) // ROW_HEIGHT))
+    last_col = grid.cols - 1
+    for r in range(hi, lo - 1, -1):
+        yc = GRID_TOP_OFFSET + (r + 0.5) * ROW_HEIGHT
+        t_in = (yc + reach - y0) / dy          # segment enters the row's band ...
+        if t_in > best_t:
+            break
+        t_out = (yc - reach - y0) / dy         # ... and leaves it
+        if t_out > t_max:
+            t_out = t_max
+        if t_in < 0.0:
+            t_in = 0.0
+        if t_in > t_out:
+            continue
+        # a centre it can touch lies within reach of the segment's x-span in the band
+        xa, xb = x0 + dx * t_in, x0 + dx * t_out
+        if xa > xb:
+            xa, xb = xb, xa
+        offset = 0.5 if grid.is_flush_left(r) else 1.0
+        c_lo = max(0, int((xa - reach - GRID_LEFT_OFFSET) / COL_WIDTH - offset))
+        c_hi = min(last_col, int((xb + reach - GRID_LEFT_OFFSET) / COL_WIDTH - offset) + 1)
+        codes = grid.codes[r]
+        for c in range(c_lo, c_hi + 1):
+            if not codes[c]:
+                continue
+            ox, oy = grid.get_position_for_cell(r, c)
+            fx, fy = x0 - ox, y0 - oy
+            b = fx * dx + fy * dy
+            k = fx * fx + fy * fy - reach_sq
+            disc = b * b - k
+            if disc < 0:
+                continue
+            t = -b - sqrt(disc)
+            if t < 0:
+                if k > 0:
+                    continue        # bubble lies behind the segment start
+                t = 0.0             # already touching
+            if t < best_t or (t == best_t and (best_cell is None or best_cell[0] == r)):
+                best_t, best_cell = t, (r, c)
+    return best_t, best_cell
+
+def solve_shot(grid, start, angle, radius=BUBBLE_RADIUS, max_bounces=64) -> ShotPath:
+    """Ray-cast a shot at angle degrees (screen y up) with wall reflection until it touches
+    an occupied cell or the ceiling. Uses the same contact distance as Bubble.move."""
+    a = radians(angle)
+    dx, dy = cos(a), -sin(a)
+    if dy >= 0:
+        raise ValueError(f"shot angle {angle} does not travel upward")
+
+    reach = 2 * (radius - 2)
+    left = GRID_LEFT_OFFSET + radius
+    right = GRID_LEFT_OFFSET + FIELD_DRAW_WIDTH - radius
+    ceiling = GRID_TOP_OFFSET + radius
+
+    x, y = start
+    points = [(x, y)]
+    for _ in range(max_bounces + 1):
+        t_ceiling = (ceiling - y) / dy
+        if dx > 0:
+            t_wall = (right - x) / dx
+        elif dx < 0:
+            t_wall = (left - x) / dx
+        else:
+            t_wall = float("inf")
+        t_end = min(t_ceiling, t_wall)
+
+        t_hit, cell = _first_hit(grid, x, y, dx, dy, t_end, reach)
+        if cell is not None:
+            points.append((x + dx * t_hit, y + dy * t_hit))
+            return ShotPath(points, cell)
+
+        if t_ceiling <= t_wall:
+            points.append((x + dx * t_ceiling, ceiling))
+            return ShotPath(points, None)
+
+        x, y = x + dx * t_wall, y + dy * t_wall
+        points.append((x, y))
+        dx = -dx
+
+    raise RuntimeError(f"shot angle {angle} exceeded {max_bounces} wall bounces")
+
+def land_shot(grid, path: ShotPath, bubble) -> tuple[int, int] | None:
+    """Stop bubble at path's contact point and snap it into grid; return its cell.
+
+    The snap is anchored on the cell under the contact point, as the step-by-step flight
+    anchored on the cell it stopped in (hit_cell only tells which bubble was struck).
+    None when no cell fits: a contact below the last row means the board overflowed.
+    """
+    bubble.pos = path.contact
+    bubble.velocity = (0.0, 0.0)
+    return grid.snap_bubble_to_grid(bubble)